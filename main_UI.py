@@ -1,15 +1,20 @@
 """Research Reader - Streamlit Web Application"""
 
 import streamlit as st
+import pandas as pd
 from pathlib import Path
 import sys
 import os
+import math
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.storage.database import PaperDatabase
+from src.storage.database import get_default_database
 from src.utils.download_service import DownloadService
 
+PAPERS_PER_PAGE = 25
+READ_ONLY = os.getenv("STREAMLIT_SERVER_HEADLESS") == "true"  # Streamlit Cloud deployment
+
 st.set_page_config(
     page_title="Research Reader",
     page_icon="📚",
@@ -24,13 +29,13 @@ def get_summarizer():
     from src.utils.conference_summarizer import ConferenceSummarizer
     return ConferenceSummarizer()
     
-@st.cache_resource
+@st.cache_resource(max_entries=1)
 def get_database():
     db_path = Path("data/database/papers.db")
     if not db_path.exists():
         st.error("❌ Database not found. Please ensure papers.db is in the repository.")
         st.stop()
-    return PaperDatabase()
+    return get_default_database()
 
 @st.cache_resource
 def get_download_service():
@@ -40,6 +45,76 @@ def get_download_service():
         st.warning(f"⚠️ Download service unavailable: {str(e)}")
         return None
 
+@st.cache_data(ttl=300, max_entries=1, show_spinner=False)
+def load_papers():
+    return get_database().get_all_papers()
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def load_recent_papers(limit):
+    return list(get_database().get_recent_papers(limit))
+
+@st.cache_data(ttl=300, max_entries=1, show_spinner=False)
+def load_statistics():
+    return get_database().get_statistics()
+
+@st.cache_data(ttl=300, max_entries=1, show_spinner=False)
+def load_conferences():
+    return get_database().get_all_conferences()
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def load_filtered_papers(conference, pdf_only, order_by):
+    return get_database().get_papers(conference=conference, pdf_only=pdf_only, order_by=order_by)
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def load_papers_table(conference, pdf_only, order_by):
+    papers = load_filtered_papers(conference, pdf_only, order_by)
+    return pd.DataFrame({
+        "ID": [p.paper_id for p in papers],
+        "Title": [p.title for p in papers],
+        "Authors": [p.authors_string for p in papers],
+        "PDF": ["📄" if p.pdf_found else "❌" for p in papers],
+        "Added": [p.created_at for p in papers],
+        "URL": [p.pdf_url if p.pdf_url and p.pdf_url.startswith("http") else None for p in papers],
+    })
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def load_search_results(query):
+    return get_database().search_papers(query)
+
+class _SummaryUnavailable(Exception):
+    """A summary couldn't be loaded or generated (e.g. Ollama is offline)."""
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def _load_cached_summary(conference_name):
+    summary = get_summarizer().get_or_generate_summary(conference_name)
+    if summary is None:
+        # st.cache_data never stores a raised exception, so the next rerun tries again
+        raise _SummaryUnavailable(conference_name)
+    return summary
+
+def load_summary(conference_name):
+    """Conference summary, cached only once one exists."""
+    try:
+        return _load_cached_summary(conference_name)
+    except _SummaryUnavailable:
+        return None
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def load_summary_info(conference_name):
+    return get_database().get_conference_summary(conference_name)
+
+def clear_data_caches():
+    """Drop cached query results after the database has been modified."""
+    load_papers.clear()
+    load_recent_papers.clear()
+    load_filtered_papers.clear()
+    load_papers_table.clear()
+    load_search_results.clear()
+    load_statistics.clear()
+    load_conferences.clear()
+    _load_cached_summary.clear()
+    load_summary_info.clear()
+
 if "selected_paper" not in st.session_state:
     st.session_state.selected_paper = None
 
@@ -61,7 +136,7 @@ st.sidebar.divider()
 with st.sidebar:
     st.subheader("📊 Quick Stats")
     
-    stats = db.get_statistics()
+    stats = load_statistics()
     
     col1, col2 = st.columns(2)
     with col1:
@@ -73,17 +148,212 @@ with st.sidebar:
 
     if st.sidebar.button("🔄 Regenerate All Summaries"):
         summarizer = get_summarizer()
-        conferences = db.get_all_conferences()
+        conferences = load_conferences()
         
         progress_bar = st.sidebar.progress(0)
-        for i, conf in enumerate(conferences):
-            st.sidebar.text(f"Processing {conf}...")
-            summarizer.get_or_generate_summary(conf, force_regenerate=True)
-            progress_bar.progress((i + 1) / len(conferences))
+        for i, (conf, _) in enumerate(summarizer.regenerate_summaries(conferences), 1):
+            st.sidebar.text(f"Processed {conf}")
+            progress_bar.progress(i / len(conferences))
         
+        _load_cached_summary.clear()
+        load_summary_info.clear()
         st.sidebar.success("All summaries regenerated!")
         st.rerun()
 
+@st.fragment
+def render_paper_entry(paper):
+    """Render one paper on the Papers page; its widgets only rerun this fragment."""
+    with st.container(border=True):
+        col_img, col_title, col_edit = st.columns([0.5, 9, 0.5], vertical_alignment="center")
+        
+        with col_img:
+            # source_rel_path / source_is_image are derived once when the paper is saved
+            if paper.source_is_image and paper.source_rel_path:
+                if st.button("🖼️", key=f"zoom_{paper.paper_id}", help="Click to view full image"):
+                    st.session_state[f"show_image_{paper.paper_id}"] = not st.session_state.get(f"show_image_{paper.paper_id}", False)
+                    st.session_state[f"image_path_{paper.paper_id}"] = paper.source_rel_path
+                    st.rerun(scope="fragment")
+            else:
+                st.caption("📄")
+        
+        with col_title:
+            st.markdown(f"### {paper.title}")
+        
+        with col_edit:
+            if st.button("✏️", key=f"edit_overview_papers_{paper.paper_id}", help="Edit overview"):
+                if READ_ONLY:
+                    st.warning("📱 Editing is disabled on Streamlit Cloud (read-only mode)")
+                else:
+                    st.session_state[f"editing_overview_{paper.paper_id}"] = True
+        
+        st.caption(f"👥 {paper.authors_string}")
+        
+        if st.session_state.get(f"show_image_{paper.paper_id}", False):
+            st.divider()
+            # Use stored path from button click
+            image_path = st.session_state.get(f"image_path_{paper.paper_id}")
+            if image_path:
+                try:
+                    st.image(image_path, caption=f"Source: {Path(image_path).name}")
+                except Exception as e:
+                    st.error(f"Could not load image: {e}")
+                    st.caption(f"Path attempted: {image_path}")
+            st.divider()
+        
+        if st.session_state.get(f"editing_overview_{paper.paper_id}", False):
+            with st.form(key=f"edit_overview_form_papers_{paper.paper_id}"):
+                edited_overview = st.text_area(
+                    "Edit Overview",
+                    value=paper.overview or "",
+                    height=200,
+                    label_visibility="collapsed"
+                )
+                
+                col_save, col_cancel = st.columns(2)
+                
+                with col_save:
+                    if st.form_submit_button("💾 Save"):
+                        if db.update_overview(paper.paper_id, edited_overview):
+                            clear_data_caches()
+                            st.success("Overview updated!")
+                            st.session_state[f"editing_overview_{paper.paper_id}"] = False
+                            st.rerun()
+                        else:
+                            st.error("Failed to update overview")
+                
+                with col_cancel:
+                    if st.form_submit_button("❌ Cancel"):
+                        st.session_state[f"editing_overview_{paper.paper_id}"] = False
+                        st.rerun(scope="fragment")
+        else:
+            if paper.overview:
+                # preview_text = paper.overview[:150]
+                # if len(paper.overview) > 150:
+                #     preview_text += "..."
+                
+                with st.expander("📝 Overview", expanded=False):
+                    st.write(paper.overview)
+                
+                # st.caption(preview_text)
+            else:
+                st.caption("_No overview available_")
+            
+        col1, col3, col4 = st.columns(3, vertical_alignment="center")
+        
+        with col1:
+            if paper.pdf_found:
+                st.success("📄 PDF Available")
+            else:
+                st.error("❌ No PDF")
+        
+        # with col2:
+        #     if paper.source_files and not READ_ONLY:
+        #         source = Path(paper.source_files[0]).name
+        #         st.caption(f"📁 {source}")
+        
+        with col3:
+            st.caption(f"🕒 {paper.created_at.strftime('%Y-%m-%d')}")
+            
+        with col4:
+            if paper.pdf_url:
+                st.link_button("📥", paper.pdf_url, help="Download PDF from arXiv")
+            elif paper.pdf_found and paper.pdf_path:
+                pdf_path = Path(paper.pdf_path)
+                if pdf_path.exists():
+                    # Passing the method, not its result, defers the read until the click
+                    st.download_button(
+                        label="📥",
+                        data=pdf_path.read_bytes,
+                        file_name=pdf_path.name,
+                        mime="application/pdf",
+                        key=f"dl_{paper.paper_id}",
+                        help="Download PDF"
+                    )
+                else:
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        if st.button("📥 Auto", key=f"download_{paper.paper_id}", help="Download from arXiv"):
+                            if not download_service:
+                                st.error("⚠️ Download service unavailable on this deployment")
+                            else:
+                                with st.spinner("Searching arXiv..."):
+                                    conference_name = paper.conference_name or "neurips2025"
+                                    success, message = download_service.download_paper(paper, conference_name)
+                                
+                                if success:
+                                    clear_data_caches()
+                                    st.success(f"✓ {message}")
+                                    if "Overview updated" in message:
+                                        st.info("📝 Detailed overview extracted from PDF")
+                                    st.rerun()
+                                else:
+                                    st.error(f"✗ {message}")
+                                    st.session_state[f"show_manual_{paper.paper_id}"] = True
+                    
+                    with col_b:
+                        if st.button("🔗 Manual", key=f"manual_{paper.paper_id}", help="Enter arXiv URL"):
+                            st.session_state[f"show_manual_{paper.paper_id}"] = True
+            else:
+                col_a, col_b = st.columns(2)
+                with col_a:
+                    if st.button("📥 Auto", key=f"download_{paper.paper_id}", help="Download from arXiv"):
+                        if not download_service:
+                            st.error("⚠️ Download service unavailable on this deployment")
+                        else:
+                            with st.spinner("Searching arXiv..."):
+                                conference_name = paper.conference_name or "neurips2025"
+                                success, message = download_service.download_paper(paper, conference_name)
+                            
+                            if success:
+                                clear_data_caches()
+                                st.success(f"✓ {message}")
+                                if "Overview updated" in message:
+                                    st.info("📝 Detailed overview extracted from PDF")
+                                st.rerun()
+                            else:
+                                st.error(f"✗ {message}")
+                                st.session_state[f"show_manual_{paper.paper_id}"] = True
+                
+                with col_b:
+                    if st.button("🔗 Manual", key=f"manual_{paper.paper_id}", help="Enter arXiv URL"):
+                        st.session_state[f"show_manual_{paper.paper_id}"] = True
+                
+                if st.session_state.get(f"show_manual_{paper.paper_id}", False):
+                    with st.form(key=f"url_form_{paper.paper_id}"):
+                        url = st.text_input(
+                            "Enter arXiv URL",
+                            placeholder="https://arxiv.org/abs/2401.12345 or https://arxiv.org/pdf/2401.12345.pdf",
+                            key=f"url_input_{paper.paper_id}"
+                        )
+                        
+                        col_submit, col_cancel = st.columns(2)
+                        
+                        with col_submit:
+                            submit = st.form_submit_button("Download")
+                        
+                        with col_cancel:
+                            cancel = st.form_submit_button("Cancel")
+                        
+                        if submit and url:
+                            if not download_service:
+                                st.error("⚠️ Download service unavailable on this deployment")
+                            else:
+                                with st.spinner("Downloading from URL..."):
+                                    conference_name = paper.conference_name or "neurips2025"
+                                    success, message = download_service.download_paper_from_url(paper, conference_name, url)
+                                
+                                if success:
+                                    clear_data_caches()
+                                    st.success(f"✓ {message}")
+                                    st.session_state[f"show_manual_{paper.paper_id}"] = False
+                                    st.rerun()
+                                else:
+                                    st.error(f"✗ {message}")
+                        
+                        if cancel:
+                            st.session_state[f"show_manual_{paper.paper_id}"] = False
+                            st.rerun(scope="fragment")
+
 if page == "🏠 Home":
     st.title("📚 Research Reader")
     st.write("Browse and search research papers extracted from conferences")
@@ -99,7 +369,7 @@ if page == "🏠 Home":
         
         with col2:
             if st.button("✏️ Edit", key="edit_summary_btn", help="Edit summary"):
-                if os.getenv("STREAMLIT_SERVER_HEADLESS") == "true":
+                if READ_ONLY:
                     st.warning("📱 Editing is disabled on Streamlit Cloud (read-only mode)")
                 else:
                     st.session_state.editing_summary = True
@@ -110,12 +380,13 @@ if page == "🏠 Home":
                 with st.spinner("Generating new summary..."):
                     summary = summarizer.get_or_generate_summary(most_recent_conference, force_regenerate=True)
                     if summary:
+                        _load_cached_summary.clear()
+                        load_summary_info.clear()
                         st.success("Summary regenerated!")
                         st.session_state.editing_summary = False
                         st.rerun()
         
-        summarizer = get_summarizer()
-        summary = summarizer.get_or_generate_summary(most_recent_conference)
+        summary = load_summary(most_recent_conference)
         
         if summary:
             if st.session_state.get("editing_summary", False):
@@ -129,7 +400,8 @@ if page == "🏠 Home":
                     with col_save:
                         if st.form_submit_button("💾 Save"):
                             if db.save_conference_summary(most_recent_conference, edited_summary, 
-                                                        len(db.get_conference_papers(most_recent_conference))):
+                                                        db.get_paper_count(most_recent_conference)):
+                                clear_data_caches()
                                 st.success("Summary updated!")
                                 st.session_state.editing_summary = False
                                 st.rerun()
@@ -144,18 +416,16 @@ if page == "🏠 Home":
                 with st.container(border=True):
                     st.markdown(summary)
                 
-                stored = db.get_conference_summary(most_recent_conference)
+                stored = load_summary_info(most_recent_conference)
                 if stored:
-                    from datetime import datetime
-                    gen_date = datetime.fromisoformat(stored['generated_at'])
-                    st.caption(f"_Generated on {gen_date.strftime('%Y-%m-%d %H:%M')} from {stored['paper_count']} papers_")
+                    st.caption(f"_Generated on {stored['generated_at'].strftime('%Y-%m-%d %H:%M')} from {stored['paper_count']} papers_")
         else:
             st.info("Unable to generate summary. Add more papers with overviews.")
         
         st.divider()
     
     st.subheader("📋 Recent Papers")
-    papers = db.get_all_papers()[:10]
+    papers = load_recent_papers(10)
     
     if papers:
         for paper in papers:
@@ -175,7 +445,7 @@ if page == "🏠 Home":
                     if st.button("✏️", key=f"edit_overview_home_{paper.paper_id}", help="Edit overview"):
                         st.session_state[f"editing_overview_{paper.paper_id}"] = True
                 
-                st.caption(paper.get_authors_string())
+                st.caption(paper.authors_string)
                 
                 if st.session_state.get(f"editing_overview_{paper.paper_id}", False):
                     with st.form(key=f"edit_overview_form_{paper.paper_id}"):
@@ -191,6 +461,7 @@ if page == "🏠 Home":
                         with col_save:
                             if st.form_submit_button("💾 Save"):
                                 if db.update_overview(paper.paper_id, edited_overview):
+                                    clear_data_caches()
                                     st.success("Overview updated!")
                                     st.session_state[f"editing_overview_{paper.paper_id}"] = False
                                     st.rerun()
@@ -222,28 +493,27 @@ elif page == "📄 Papers":
                 st.error("⚠️ Download service unavailable on this deployment")
             else:
                 with st.spinner("Downloading missing PDFs..."):
-                    stats = download_service.download_all_missing()
+                    download_stats = download_service.download_all_missing()
                 
-                if stats['success'] > 0:
-                    st.success(f"✓ Downloaded {stats['success']} PDF(s) with detailed overviews")
+                if download_stats['success'] > 0:
+                    st.success(f"✓ Downloaded {download_stats['success']} PDF(s) with detailed overviews")
                 
-                if stats['failed'] > 0:
-                    st.warning(f"⚠️ Failed: {stats['failed']} PDF(s)")
+                if download_stats['failed'] > 0:
+                    st.warning(f"⚠️ Failed: {download_stats['failed']} PDF(s)")
                 
-                if stats['success'] > 0:
+                if download_stats['success'] > 0:
+                    clear_data_caches()
                     st.rerun()
     
     st.divider()
     
-    papers = db.get_all_papers()
-    
-    if not papers:
+    if stats['total_papers'] == 0:
         st.info("No papers found in database.")
     else:
         col1, col2, col3 = st.columns([2, 2, 1])
 
         with col1:
-            conferences = ["All"] + db.get_all_conferences()
+            conferences = ["All"] + load_conferences()
             selected_conference = st.selectbox(
                 "Conference",
                 options=conferences,
@@ -259,229 +529,67 @@ elif page == "📄 Papers":
                 ["Title (A-Z)", "Title (Z-A)", "Newest First"],
             )
 
-        filtered = papers.copy()
-
-        if selected_conference != "All":
-            filtered = [p for p in filtered if p.conference_name == selected_conference]
-
-        if pdf_filter:
-            filtered = [p for p in filtered if p.pdf_found]
-
-        if sort_by == "Title (Z-A)":
-            filtered.sort(key=lambda p: p.title, reverse=True)
-        elif sort_by == "Title (A-Z)":
-            filtered.sort(key=lambda p: p.title)
-        else:
-            filtered.sort(key=lambda p: p.created_at, reverse=True)
+        sort_keys = {"Title (A-Z)": "title", "Title (Z-A)": "title_desc", "Newest First": "newest"}
+        filtered = load_filtered_papers(
+            None if selected_conference == "All" else selected_conference,
+            pdf_filter,
+            sort_keys[sort_by]
+        )
     
-        st.write(f"**Showing {len(filtered)} paper(s)**")
-        st.divider()
+        view_mode = st.radio("View", ["Table", "Cards"], horizontal=True)
         
-        for paper in filtered:
-            with st.container(border=True):
-                col_img, col_title, col_edit = st.columns([0.5, 9, 0.5], vertical_alignment="center")
-                
-                with col_img:
-                    if paper.source_files:
-                        # Convert absolute Windows path to cloud-friendly path
-                        source_str = str(paper.source_files[0])
-                        
-                        # Extract path from 'data' directory onwards
-                        if 'data' in source_str:
-                            # Find 'data' in the path and extract everything from there
-                            data_idx = source_str.lower().find('data')
-                            if data_idx != -1:
-                                # Get substring from 'data' onwards and normalize to forward slashes
-                                rel_path = source_str[data_idx:].replace('\\', '/')
-                            else:
-                                rel_path = source_str
-                        else:
-                            rel_path = source_str
-                        
-                        # Show button if it's an image file (trust database, check extension only)
-                        if rel_path.lower().endswith(('.png', '.jpg', '.jpeg')):
-                            if st.button("🖼️", key=f"zoom_{paper.paper_id}", help="Click to view full image"):
-                                st.session_state[f"show_image_{paper.paper_id}"] = not st.session_state.get(f"show_image_{paper.paper_id}", False)
-                                st.session_state[f"image_path_{paper.paper_id}"] = rel_path
-                                st.rerun()
-                        else:
-                            st.caption("📄")
-                    else:
-                        st.caption("📄")
-                
-                with col_title:
-                    st.markdown(f"### {paper.title}")
-                
-                with col_edit:
-                    if st.button("✏️", key=f"edit_overview_papers_{paper.paper_id}", help="Edit overview"):
-                        if os.getenv("STREAMLIT_SERVER_HEADLESS") == "true":
-                            st.warning("📱 Editing is disabled on Streamlit Cloud (read-only mode)")
-                        else:
-                            st.session_state[f"editing_overview_{paper.paper_id}"] = True
-                
-                st.caption(f"👥 {paper.get_authors_string()}")
-                
-                if st.session_state.get(f"show_image_{paper.paper_id}", False):
-                    st.divider()
-                    # Use stored path from button click
-                    image_path = st.session_state.get(f"image_path_{paper.paper_id}")
-                    if image_path:
-                        try:
-                            st.image(image_path, caption=f"Source: {Path(image_path).name}")
-                        except Exception as e:
-                            st.error(f"Could not load image: {e}")
-                            st.caption(f"Path attempted: {image_path}")
-                    st.divider()
-                
-                if st.session_state.get(f"editing_overview_{paper.paper_id}", False):
-                    with st.form(key=f"edit_overview_form_papers_{paper.paper_id}"):
-                        edited_overview = st.text_area(
-                            "Edit Overview",
-                            value=paper.overview or "",
-                            height=200,
-                            label_visibility="collapsed"
-                        )
-                        
-                        col_save, col_cancel = st.columns(2)
-                        
-                        with col_save:
-                            if st.form_submit_button("💾 Save"):
-                                if db.update_overview(paper.paper_id, edited_overview):
-                                    st.success("Overview updated!")
-                                    st.session_state[f"editing_overview_{paper.paper_id}"] = False
-                                    st.rerun()
-                                else:
-                                    st.error("Failed to update overview")
-                        
-                        with col_cancel:
-                            if st.form_submit_button("❌ Cancel"):
-                                st.session_state[f"editing_overview_{paper.paper_id}"] = False
-                                st.rerun()
-                else:
-                    if paper.overview:
-                        # preview_text = paper.overview[:150]
-                        # if len(paper.overview) > 150:
-                        #     preview_text += "..."
-                        
-                        with st.expander("📝 Overview", expanded=False):
-                            st.write(paper.overview)
-                        
-                        # st.caption(preview_text)
-                    else:
-                        st.caption("_No overview available_")
-                    
-                col1, col3, col4 = st.columns(3, vertical_alignment="center")
-                
-                with col1:
-                    if paper.pdf_found:
-                        st.success("📄 PDF Available")
-                    else:
-                        st.error("❌ No PDF")
-                
-                # with col2:
-                #     if paper.source_files and os.getenv("STREAMLIT_SERVER_HEADLESS") != "true":
-                #         source = Path(paper.source_files[0]).name
-                #         st.caption(f"📁 {source}")
-                
-                with col3:
-                    st.caption(f"🕒 {paper.created_at.strftime('%Y-%m-%d')}")
-                    
-                with col4:
-                    if paper.pdf_url:
-                        st.link_button("📥", paper.pdf_url, help="Download PDF from arXiv")
-                    elif paper.pdf_found and paper.pdf_path:
-                        pdf_path = Path(paper.pdf_path)
-                        if pdf_path.exists():
-                            with open(pdf_path, "rb") as pdf_file:
-                                st.download_button(
-                                    label="📥",
-                                    data=pdf_file,
-                                    file_name=pdf_path.name,
-                                    mime="application/pdf",
-                                    key=f"dl_{paper.paper_id}",
-                                    help="Download PDF"
-                                )
-                        else:
-                            col_a, col_b = st.columns(2)
-                            with col_a:
-                                if st.button("📥 Auto", key=f"download_{paper.paper_id}", help="Download from arXiv"):
-                                    if not download_service:
-                                        st.error("⚠️ Download service unavailable on this deployment")
-                                    else:
-                                        with st.spinner("Searching arXiv..."):
-                                            conference_name = paper.conference_name or "neurips2025"
-                                            success, message = download_service.download_paper(paper, conference_name)
-                                        
-                                        if success:
-                                            st.success(f"✓ {message}")
-                                            if "Overview updated" in message:
-                                                st.info("📝 Detailed overview extracted from PDF")
-                                            st.rerun()
-                                        else:
-                                            st.error(f"✗ {message}")
-                                            st.session_state[f"show_manual_{paper.paper_id}"] = True
-                            
-                            with col_b:
-                                if st.button("🔗 Manual", key=f"manual_{paper.paper_id}", help="Enter arXiv URL"):
-                                    st.session_state[f"show_manual_{paper.paper_id}"] = True
-                    else:
-                        col_a, col_b = st.columns(2)
-                        with col_a:
-                            if st.button("📥 Auto", key=f"download_{paper.paper_id}", help="Download from arXiv"):
-                                if not download_service:
-                                    st.error("⚠️ Download service unavailable on this deployment")
-                                else:
-                                    with st.spinner("Searching arXiv..."):
-                                        conference_name = paper.conference_name or "neurips2025"
-                                        success, message = download_service.download_paper(paper, conference_name)
-                                    
-                                    if success:
-                                        st.success(f"✓ {message}")
-                                        if "Overview updated" in message:
-                                            st.info("📝 Detailed overview extracted from PDF")
-                                        st.rerun()
-                                    else:
-                                        st.error(f"✗ {message}")
-                                        st.session_state[f"show_manual_{paper.paper_id}"] = True
-                        
-                        with col_b:
-                            if st.button("🔗 Manual", key=f"manual_{paper.paper_id}", help="Enter arXiv URL"):
-                                st.session_state[f"show_manual_{paper.paper_id}"] = True
-                        
-                        if st.session_state.get(f"show_manual_{paper.paper_id}", False):
-                            with st.form(key=f"url_form_{paper.paper_id}"):
-                                url = st.text_input(
-                                    "Enter arXiv URL",
-                                    placeholder="https://arxiv.org/abs/2401.12345 or https://arxiv.org/pdf/2401.12345.pdf",
-                                    key=f"url_input_{paper.paper_id}"
-                                )
-                                
-                                col_submit, col_cancel = st.columns(2)
-                                
-                                with col_submit:
-                                    submit = st.form_submit_button("Download")
-                                
-                                with col_cancel:
-                                    cancel = st.form_submit_button("Cancel")
-                                
-                                if submit and url:
-                                    if not download_service:
-                                        st.error("⚠️ Download service unavailable on this deployment")
-                                    else:
-                                        with st.spinner("Downloading from URL..."):
-                                            conference_name = paper.conference_name or "neurips2025"
-                                            success, message = download_service.download_paper_from_url(paper, conference_name, url)
-                                        
-                                        if success:
-                                            st.success(f"✓ {message}")
-                                            st.session_state[f"show_manual_{paper.paper_id}"] = False
-                                            st.rerun()
-                                        else:
-                                            st.error(f"✗ {message}")
-                                
-                                if cancel:
-                                    st.session_state[f"show_manual_{paper.paper_id}"] = False
-                                    st.rerun()
+        if view_mode == "Table":
+            st.write(f"**Showing {len(filtered)} paper(s)**")
+            
+            # One dataframe instead of a container of widgets per paper
+            table = load_papers_table(
+                None if selected_conference == "All" else selected_conference,
+                pdf_filter,
+                sort_keys[sort_by]
+            )
+            selection = st.dataframe(
+                table,
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "ID": None,
+                    "Added": st.column_config.DateColumn("Added", format="YYYY-MM-DD"),
+                    "URL": st.column_config.LinkColumn("URL", display_text="📥"),
+                },
+                on_select="rerun",
+                selection_mode="single-row",
+                key="papers_table"
+            )
+            
+            st.divider()
+            
+            # The table and `filtered` are cached separately, so map the row back by paper id
+            selected_paper = None
+            selected_rows = selection.selection.rows
+            if selected_rows and selected_rows[0] < len(table):
+                selected_id = table["ID"].iat[selected_rows[0]]
+                selected_paper = next((p for p in filtered if p.paper_id == selected_id), None)
+            
+            if selected_paper is not None:
+                render_paper_entry(selected_paper)
+            else:
+                st.caption("Select a row to view, edit or download a paper")
+        else:
+            page_count = max(1, math.ceil(len(filtered) / PAPERS_PER_PAGE))
+            col_count, col_page = st.columns([4, 1], vertical_alignment="bottom")
+            
+            with col_page:
+                page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+            
+            start = (page_number - 1) * PAPERS_PER_PAGE
+            page_papers = filtered[start:start + PAPERS_PER_PAGE]
+            
+            with col_count:
+                st.write(f"**Showing {len(page_papers)} of {len(filtered)} paper(s)** (page {page_number} of {page_count})")
+            st.divider()
+            
+            for paper in page_papers:
+                render_paper_entry(paper)
 
 elif page == "🔍 Search":
     st.title("🔍 Search Papers")
@@ -495,7 +603,7 @@ elif page == "🔍 Search":
     
     if query:
         with st.spinner("Searching..."):
-            results = db.search_papers(query)
+            results = load_search_results(query)
         
         st.write(f"**Found {len(results)} result(s)**")
         st.divider()
@@ -504,7 +612,7 @@ elif page == "🔍 Search":
             for paper in results:
                 with st.container(border=True):
                     st.markdown(f"### {paper.title}")
-                    st.caption(f"👥 {paper.get_authors_string()}")
+                    st.caption(f"👥 {paper.authors_string}")
                     
                     if paper.overview:
                         st.write(paper.overview)
@@ -538,7 +646,7 @@ elif page == "🔍 Search":
 elif page == "📈 Analytics":
     st.title("📈 Analytics")
     
-    papers = db.get_all_papers()
+    papers = load_papers()
     
     if not papers:
         st.info("No papers to analyze yet.")
@@ -1,9 +1,33 @@
 """Conference folder structure management."""
+import os
 from pathlib import Path
 from typing import Optional, Dict
 from dataclasses import dataclass
+from functools import lru_cache
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # LibYAML C extension
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def load_config(config_path: str) -> dict:
+    """
+    Load and cache configuration from YAML file.
+    
+    The returned dict is shared between callers and must not be mutated.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        Parsed configuration
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 @dataclass
 class ConferenceFolder:
@@ -21,11 +45,23 @@ class ConferenceFolder:
         Returns:
             Dictionary with existence status for each folder
         """
+        # One directory listing of root instead of a stat() per folder
+        try:
+            with os.scandir(self.root_path) as entries:
+                children = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return {'root': self.root_path.exists(), 'images': False, 'pdfs': False, 'output': False}
+        
+        def _exists(path: Path) -> bool:
+            if path.parent == self.root_path:
+                return path.name in children
+            return path.exists()
+        
         return {
-            'root': self.root_path.exists(),
-            'images': self.images_path.exists(),
-            'pdfs': self.pdfs_path.exists(),
-            'output': self.output_path.exists()
+            'root': True,
+            'images': _exists(self.images_path),
+            'pdfs': _exists(self.pdfs_path),
+            'output': _exists(self.output_path)
         }
     
     def create_missing_folders(self):
@@ -39,20 +75,20 @@ class ConferenceFolder:
 class ConferenceManager:
     """Manages conference folder structure."""
     
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", config: Optional[dict] = None):
         """
         Initialize conference manager.
         
         Args:
             config_path: Path to configuration file
+            config: Already-parsed configuration (skips reading config_path)
         """
-        self.config = self._load_config(config_path)
+        self.config = config if config is not None else self._load_config(config_path)
         self.data_root = Path(self.config['project']['data_root'])
     
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file."""
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_config(str(config_path))
     
     def get_conference(self, conference_name: Optional[str] = None) -> ConferenceFolder:
         """
@@ -91,9 +127,6 @@ class ConferenceManager:
         if not self.data_root.exists():
             return []
         
-        conferences = []
-        for item in self.data_root.iterdir():
-            if item.is_dir():
-                conferences.append(item.name)
-        
-        return sorted(conferences)
\ No newline at end of file
+        # DirEntry.is_dir() uses the type reported by the directory listing (no extra stat)
+        with os.scandir(self.data_root) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
\ No newline at end of file
@@ -1,8 +1,11 @@
 """Core data models for the research reader."""
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 from enum import Enum
+from dataclasses import dataclass, field
+from functools import cached_property
 from pydantic import BaseModel, Field
 import uuid
 
@@ -21,7 +24,7 @@ class Author(BaseModel):
 
 class PaperMetadata(BaseModel):
     """Extracted paper metadata - simplified to essential fields only."""
-    paper_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    paper_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str
     authors: List[Author] = []
     overview: Optional[str] = "Unknown"
@@ -34,28 +37,42 @@ class PaperMetadata(BaseModel):
     
     # Metadata
     source_files: List[str] = []
+    source_rel_path: Optional[str] = None  # First source file relative to 'data/', set on DB save
+    source_is_image: bool = False
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     version: int = 1
     
+    @cached_property
+    def author_names(self) -> tuple:
+        """Author names in order, collected once per instance."""
+        return tuple(a.name for a in self.authors)
+    
     def get_authors_string(self, max_authors: int = 30) -> str:
         """Get formatted author string."""
-        if not self.authors:
+        names = self.author_names
+        if not names:
             return "Unknown Authors"
         
-        if len(self.authors) <= max_authors:
-            return ", ".join(a.name for a in self.authors)
+        if len(names) <= max_authors:
+            return ", ".join(names)
         
-        shown = ", ".join(a.name for a in self.authors[:max_authors])
-        remaining = len(self.authors) - max_authors
+        shown = ", ".join(names[:max_authors])
+        remaining = len(names) - max_authors
         return f"{shown}, +{remaining} more"
+    
+    @cached_property
+    def authors_string(self) -> str:
+        """Default formatted author string, computed once per instance."""
+        return self.get_authors_string()
 
 
-class Conference(BaseModel):
+@dataclass(slots=True)
+class Conference:
     """Conference metadata."""
     name: str
-    year: Optional[int] = None
     path: Path
+    year: Optional[int] = None
     
     @property
     def images_path(self) -> Path:
@@ -73,12 +90,43 @@ class Conference(BaseModel):
         return self.path / "output"
 
 
-class SourceFile(BaseModel):
+@dataclass(slots=True)
+class SourceFile:
     """Source file metadata."""
     file_path: Path
-    file_type: FileType  # Using the FileType enum
-    file_size: int = 0
-    modified_date: Optional[datetime] = None
+    file_type: FileType
+    size: Optional[int] = None  # raw st_size; None until stat'ed
+    mtime: Optional[float] = None  # raw st_mtime, converted on first access
+    _modified_date: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _load_stat(self):
+        """Fill size and mtime with a single stat() call."""
+        try:
+            stats = os.stat(self.file_path)
+        except OSError:
+            self.size = 0 if self.size is None else self.size
+            return
+        if self.size is None:
+            self.size = stats.st_size
+        if self.mtime is None:
+            self.mtime = stats.st_mtime
+    
+    @property
+    def file_size(self) -> int:
+        """Get file size in bytes."""
+        if self.size is None:
+            self._load_stat()
+        return self.size
+    
+    @property
+    def modified_date(self) -> Optional[datetime]:
+        """Get last modification time."""
+        if self._modified_date is None:
+            if self.mtime is None:
+                self._load_stat()
+            if self.mtime is not None:
+                self._modified_date = datetime.fromtimestamp(self.mtime)
+        return self._modified_date
     
     @property
     def name(self) -> str:
@@ -94,7 +142,3 @@ class SourceFile(BaseModel):
     def size_mb(self) -> float:
         """Get file size in MB."""
         return self.file_size / (1024 * 1024)
-    
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
\ No newline at end of file
@@ -1,27 +1,39 @@
 """File system scanner for discovering research papers."""
+import logging
+import os
 from pathlib import Path
-from typing import List, Set, Optional
-from datetime import datetime
+from types import MappingProxyType
+from typing import List, Set, Optional, Mapping
 
 from .models import SourceFile, FileType
 
+logger = logging.getLogger(__name__)
+
 
 class FileScanner:
     """Scans directories for PDF and image files."""
     
     def __init__(self, 
                  image_extensions: Optional[Set[str]] = None,
-                 pdf_extensions: Optional[Set[str]] = None):
+                 pdf_extensions: Optional[Set[str]] = None,
+                 collect_stat: bool = False):
         """
         Initialize scanner.
         
         Args:
             image_extensions: Set of image file extensions
             pdf_extensions: Set of PDF file extensions
+            collect_stat: stat() every file while scanning instead of on first
+                access to SourceFile.file_size / modified_date
         """
+        self.collect_stat = collect_stat
         self.image_extensions = image_extensions or {".jpg", ".jpeg", ".png", ".heic"}
         self.pdf_extensions = pdf_extensions or {".pdf"}
         
+        # Single lookup table for extension -> type (PDF wins if listed in both)
+        self._ext_to_type = {ext: FileType.IMAGE for ext in self.image_extensions}
+        self._ext_to_type.update({ext: FileType.PDF for ext in self.pdf_extensions})
+        
         self.stats = {
             "total_scanned": 0,
             "pdfs_found": 0,
@@ -67,25 +79,29 @@ class FileScanner:
             List of discovered source files
         """
         if not root_path.exists():
-            print(f"⚠️  Path does not exist: {root_path}")
+            logger.warning("Path does not exist: %s", root_path)
             return []
         
         if not root_path.is_dir():
-            print(f"⚠️  Path is not a directory: {root_path}")
+            logger.warning("Path is not a directory: %s", root_path)
             return []
         
-        print(f"🔍 Scanning: {root_path}")
+        logger.debug("Scanning: %s", root_path)
         source_files = []
         
-        # Only scan immediate directory (no recursion)
-        for file_path in root_path.iterdir():
-            if file_path.is_file():
+        # Only scan immediate directory (no recursion). DirEntry caches the file type
+        # from the directory listing, so is_file() needs no extra stat() per entry.
+        with os.scandir(root_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                
                 self.stats["total_scanned"] += 1
-                source_file = self._create_source_file(file_path)
+                source_file = self._create_source_file(entry)
                 
                 if source_file:
                     # Apply filter if specified
-                    if file_type_filter is None or source_file.file_type == file_type_filter.value:
+                    if file_type_filter is None or source_file.file_type == file_type_filter:
                         source_files.append(source_file)
                         
                         if source_file.file_type == FileType.PDF:
@@ -95,64 +111,64 @@ class FileScanner:
                 else:
                     self.stats["skipped"] += 1
         
-        print(f"✅ Found {len(source_files)} files")
+        logger.info("Found %d files in %s (%d scanned, %d skipped so far)",
+                    len(source_files), root_path,
+                    self.stats["total_scanned"], self.stats["skipped"])
         return sorted(source_files, key=lambda x: x.file_path.name)
     
-    def _create_source_file(self, file_path: Path) -> Optional[SourceFile]:
+    def _create_source_file(self, entry: os.DirEntry) -> Optional[SourceFile]:
         """
         Create SourceFile object if file type is supported.
         
         Args:
-            file_path: Path to file
+            entry: Directory entry for the file
             
         Returns:
             SourceFile object or None if unsupported
         """
-        file_type = self._detect_file_type(file_path)
+        # Check the extension on the bare name before paying for Path or stat()
+        file_type = self._detect_file_type(entry.name)
         
         if file_type == FileType.UNKNOWN:
             return None
         
+        if not self.collect_stat:
+            return SourceFile(file_path=Path(entry.path), file_type=file_type)
+        
         try:
-            stats = file_path.stat()
+            stats = entry.stat()
             return SourceFile(
-                file_path=file_path,
+                file_path=Path(entry.path),
                 file_type=file_type,
-                file_size=stats.st_size,
-                modified_date=datetime.fromtimestamp(stats.st_mtime)
+                size=stats.st_size,
+                mtime=stats.st_mtime
             )
         except Exception as e:
-            print(f"⚠️  Error reading {file_path}: {e}")
+            logger.warning("Error reading %s: %s", entry.path, e)
             return None
     
-    def _detect_file_type(self, file_path: Path) -> FileType:
+    def _detect_file_type(self, file_name: str) -> FileType:
         """
         Detect file type from extension.
         
         Args:
-            file_path: Path to file
+            file_name: Name of the file
             
         Returns:
             FileType enum
         """
-        extension = file_path.suffix.lower()
-        
-        if extension in self.pdf_extensions:
-            return FileType.PDF
-        elif extension in self.image_extensions:
-            return FileType.IMAGE
-        else:
+        dot = file_name.rfind('.')
+        if dot <= 0:  # no extension, or a dotfile like ".pdf"
             return FileType.UNKNOWN
+        
+        return self._ext_to_type.get(file_name[dot:].lower(), FileType.UNKNOWN)
     
-    def get_statistics(self) -> dict:
-        """Get scan statistics."""
-        return self.stats.copy()
+    def get_statistics(self) -> Mapping[str, int]:
+        """Get scan statistics as a live read-only view (copy it to snapshot)."""
+        return MappingProxyType(self.stats)
     
     def reset_statistics(self):
         """Reset scan statistics."""
-        self.stats = {
-            "total_scanned": 0,
-            "pdfs_found": 0,
-            "images_found": 0,
-            "skipped": 0
-        }
\ No newline at end of file
+        # Reset in place so views returned by get_statistics stay attached
+        for key in self.stats:
+            self.stats[key] = 0
\ No newline at end of file
@@ -1,6 +1,20 @@
 # filepath: src/extractors/__init__.py
 """Extraction modules for different file types."""
-from .ollama_client import OllamaClient
-from .image_extractor import ImageExtractor
+from importlib import import_module
 
-__all__ = ['OllamaClient', 'ImageExtractor']
\ No newline at end of file
+# Public names are imported on first access (PEP 562) so importing a single
+# submodule does not pull in requests/rich through this package
+_LAZY_EXPORTS = {
+    'OllamaClient': '.ollama_client',
+    'ImageExtractor': '.image_extractor',
+}
+
+__all__ = ['OllamaClient', 'ImageExtractor']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,36 @@
 """Extract paper information from poster images using vision models."""
 import json
-import re
+import threading
+from functools import cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, List
+from types import MappingProxyType
+from typing import Dict, Optional, List, Mapping
 from datetime import datetime
-from rich.console import Console
 
 from ..core.models import SourceFile, PaperMetadata, Author
 from .ollama_client import OllamaClient
 from .prompts import get_extraction_prompt
 from .json_utils import extract_json_safely, validate_paper_data
 
-console = Console()
+
+@cache
+def _console():
+    """Shared rich console, imported on first verbose output."""
+    from rich.console import Console
+    return Console()
+
 
 class ImageExtractor:
     """Extract structured paper data from poster images."""
     
     def __init__(self, model_name: str = "llama3.2-vision:11b",
-                 temperature: float = 0.1, verbose: bool = True):
+                 temperature: float = 0.1, verbose: bool = True, max_workers: int = 4):
         self.client = OllamaClient(model_name=model_name)
         self.temperature = temperature
         self.verbose = verbose
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
         
         self.stats = {
             "processed": 0,
@@ -30,6 +40,11 @@ class ImageExtractor:
             "retries": 0
         }
     
+    def _increment_stat(self, key: str):
+        """Increment a statistics counter (safe across batch_extract workers)."""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
     def extract_from_image(self, source_file: SourceFile, retry:bool = True) -> Dict:
         """Extract paper metadata from poster image."""
         result = {
@@ -42,7 +57,7 @@ class ImageExtractor:
         
         if not self.client.check_connection():
             result['error'] = "Cannot connect to Ollama. Is it running?"
-            self.stats['failed'] += 1
+            self._increment_stat('failed')
             return result
         
         # Try with detailed prompt first
@@ -51,12 +66,12 @@ class ImageExtractor:
         # If failed and retry enabled, try with simpler prompt
         if not result['success'] and retry:
             if self.verbose:
-                console.print("[yellow]Retrying with simpler prompt...[/yellow]")
+                _console().print("[yellow]Retrying with simpler prompt...[/yellow]")
             
-            self.stats['retries'] += 1
+            self._increment_stat('retries')
             result = self._attempt_extraction(source_file, use_simple=True)
         
-        self.stats['processed'] += 1
+        self._increment_stat('processed')
         return result
     
     def _attempt_extraction(self, source_file: SourceFile, use_simple: bool = False) -> Dict:
@@ -73,8 +88,8 @@ class ImageExtractor:
         
         if self.verbose:
             prompt_type = "simple" if use_simple else "detailed"
-            console.print(f"\n[cyan]Processing:[/cyan] {source_file.file_path.name} ({prompt_type} prompt)")
-            console.print(f"[dim]Sending to Ollama...[/dim]")
+            _console().print(f"\n[cyan]Processing:[/cyan] {source_file.file_path.name} ({prompt_type} prompt)")
+            _console().print(f"[dim]Sending to Ollama...[/dim]")
         
         start_time = datetime.now()
         response = self.client.analyze_image(image_path=source_file.file_path, prompt=prompt, temperature=self.temperature)
@@ -83,25 +98,25 @@ class ImageExtractor:
         result['processing_time'] = (end_time - start_time).total_seconds()
         
         if self.verbose:
-            console.print(f"[green]✓ Ollama responded in {result['processing_time']:.1f} seconds[/green]")
+            _console().print(f"[green]✓ Ollama responded in {result['processing_time']:.1f} seconds[/green]")
         
         if not response['success']:
             result['error'] = response['error']
-            self.stats['failed'] += 1
+            self._increment_stat('failed')
             if self.verbose:
-                console.print(f"[red]✗ Error: {result['error']}[/red]")
+                _console().print(f"[red]✗ Error: {result['error']}[/red]")
             return result
         
         result['raw_response'] = response['response']
         
         if self.verbose:
-            console.print("\n[bold]Raw Model Response:[/bold]")
-            console.print("[dim]" + "="*60 + "[/dim]")
-            console.print(result['raw_response'])
-            console.print("[dim]" + "="*60 + "[/dim]\n")
+            _console().print("\n[bold]Raw Model Response:[/bold]")
+            _console().print("[dim]" + "="*60 + "[/dim]")
+            _console().print(result['raw_response'])
+            _console().print("[dim]" + "="*60 + "[/dim]\n")
         
         if self.verbose:
-            console.print("[cyan]Attempting to parse JSON...[/cyan]")
+            _console().print("[cyan]Attempting to parse JSON...[/cyan]")
         
         paper_metadata = self._parse_response(
             response['response'], 
@@ -111,14 +126,14 @@ class ImageExtractor:
         if paper_metadata:
             result['success'] = True
             result['paper_metadata'] = paper_metadata
-            self.stats['successful'] += 1
+            self._increment_stat('successful')
             if self.verbose:
-                console.print("[green]✓ Successfully parsed paper metadata[/green]")
+                _console().print("[green]✓ Successfully parsed paper metadata[/green]")
         else:
             result['error'] = "Failed to parse model response as JSON"
-            self.stats['json_errors'] += 1
+            self._increment_stat('json_errors')
             if self.verbose:
-                console.print("[red]✗ JSON parsing failed[/red]")
+                _console().print("[red]✗ JSON parsing failed[/red]")
         
         return result
     
@@ -141,63 +156,40 @@ class ImageExtractor:
             
             if data is None:
                 if self.verbose:
-                    console.print("[red]Could not extract valid JSON from response[/red]")
+                    _console().print("[red]Could not extract valid JSON from response[/red]")
                 return None
             
             # Validate and fix data structure
             data = validate_paper_data(data)
             
             if self.verbose:
-                console.print("[green]✓ JSON parsed and validated[/green]")
+                _console().print("[green]✓ JSON parsed and validated[/green]")
             
-            # Create Author objects (just names)
+            # validate_paper_data already normalized the types, so skip pydantic validation
             authors = []
             for author_name in data.get('authors', []):
                 if author_name:
-                    authors.append(Author(name=author_name))
+                    authors.append(Author.model_construct(name=author_name))
             
-            # Create PaperMetadata with simplified fields
-            paper = PaperMetadata(
+            # Create PaperMetadata with simplified fields (defaults are still applied)
+            now = datetime.now()
+            paper = PaperMetadata.model_construct(
                 title=data.get('title', 'Untitled'),
                 authors=authors,
                 overview=data.get('overview'),
                 source_files=[str(source_path)],
-                pdf_found=False  # Will be updated later when matching PDFs
+                pdf_found=False,  # Will be updated later when matching PDFs
+                created_at=now,
+                updated_at=now
             )
             
             return paper
             
         except Exception as e:
             if self.verbose:
-                console.print(f"[red]⚠️  Error creating PaperMetadata:[/red] {e}")
+                _console().print(f"[red]⚠️  Error creating PaperMetadata:[/red] {e}")
             return None
     
-    def _clean_json_response(self, text: str) -> str:
-        """
-        Clean LLM response to extract JSON.
-        
-        Sometimes models wrap JSON in markdown:
-        ```json
-        { ... }
-        ```
-        
-        Args:
-            text: Raw response text
-            
-        Returns:
-            Cleaned JSON string
-        """
-        # Remove markdown code blocks
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*', '', text)
-        
-        # Find JSON object (starts with { ends with })
-        match = re.search(r'\{.*\}', text, re.DOTALL)
-        if match:
-            return match.group(0)
-        
-        return text.strip()
-    
     def batch_extract(self, source_files: List[SourceFile]) -> List[Dict]:
         """
         Extract from multiple images.
@@ -206,15 +198,23 @@ class ImageExtractor:
             source_files: List of SourceFile objects
             
         Returns:
-            List of extraction results
+            List of extraction results, in the same order as source_files
         """
-        results = []
-        for source_file in source_files:
-            result = self.extract_from_image(source_file)
-            results.append(result)
+        if self.max_workers <= 1 or len(source_files) <= 1:
+            return [self.extract_from_image(source_file) for source_file in source_files]
+        
+        # Keep several requests in flight so file reads and encoding overlap with inference
+        results: List[Dict] = [{}] * len(source_files)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.extract_from_image, source_file): i
+                for i, source_file in enumerate(source_files)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
         return results
     
-    def get_statistics(self) -> Dict:
-        """Get extraction statistics."""
-        return self.stats.copy()
\ No newline at end of file
+    def get_statistics(self) -> Mapping[str, int]:
+        """Get extraction statistics as a live read-only view (copy it to snapshot)."""
+        return MappingProxyType(self.stats)
\ No newline at end of file
@@ -1,8 +1,21 @@
 """Utilities for handling and sanitizing JSON responses."""
-import json
 import re
+import orjson
 from typing import Optional, Dict, Any
 
+_RE_JSON_FENCE = re.compile(r'```json\s*', re.IGNORECASE)
+_RE_FENCE = re.compile(r'```\s*')
+_RE_OBJECT = re.compile(r'\{.*\}', re.DOTALL)
+_RE_SINGLE_QUOTED_KEY = re.compile(r"'([^']*)':")
+_RE_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_RE_NONE = re.compile(r'\bNone\b')
+_RE_TRUE = re.compile(r'\bTrue\b')
+_RE_FALSE = re.compile(r'\bFalse\b')
+_RE_MULTILINE_VALUE = re.compile(r':\s*"([^"]*\n[^"]*)"')
+
+# Control characters other than \t, \n and \r, mapped to None for str.translate
+_CONTROL_CHARS = dict.fromkeys(i for i in range(32) if i not in (9, 10, 13))
+
 
 def sanitize_json_string(text: str) -> str:
     """
@@ -15,31 +28,31 @@ def sanitize_json_string(text: str) -> str:
         Cleaned JSON string
     """
     # Remove markdown code blocks
-    text = re.sub(r'```json\s*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'```\s*', '', text)
+    text = _RE_JSON_FENCE.sub('', text)
+    text = _RE_FENCE.sub('', text)
     
     # Remove any text before first { and after last }
-    match = re.search(r'\{.*\}', text, re.DOTALL)
+    match = _RE_OBJECT.search(text)
     if match:
         text = match.group(0)
     
     # Fix common issues
     # 1. Replace single quotes with double quotes (only around keys/values)
-    text = re.sub(r"'([^']*)':", r'"\1":', text)  # Keys
+    text = _RE_SINGLE_QUOTED_KEY.sub(r'"\1":', text)  # Keys
     
     # 2. Remove trailing commas before closing braces/brackets
-    text = re.sub(r',(\s*[}\]])', r'\1', text)
+    text = _RE_TRAILING_COMMA.sub(r'\1', text)
     
     # 3. Fix None to null
-    text = re.sub(r'\bNone\b', 'null', text)
+    text = _RE_NONE.sub('null', text)
     
     # 4. Fix True/False to true/false
-    text = re.sub(r'\bTrue\b', 'true', text)
-    text = re.sub(r'\bFalse\b', 'false', text)
+    text = _RE_TRUE.sub('true', text)
+    text = _RE_FALSE.sub('false', text)
     
     # 5. Remove control characters (except \n, \r, \t which are valid in JSON strings)
     # This fixes "Invalid control character" errors
-    text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\r\t')
+    text = text.translate(_CONTROL_CHARS)
     
     # 6. Escape unescaped quotes inside string values
     # This is tricky - we'll use a more conservative approach
@@ -47,6 +60,38 @@ def sanitize_json_string(text: str) -> str:
     return text.strip()
 
 
+def _first_balanced_object(text: str, start: int) -> Optional[str]:
+    """
+    Return the first brace-balanced {...} span starting at text[start].
+    
+    Braces inside string literals are ignored. Runs in linear time, unlike a
+    nested-group regex which can backtrack badly on malformed input.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
+
+
 def extract_json_safely(text: str) -> Optional[Dict[str, Any]]:
     """
     Try multiple strategies to extract valid JSON from text.
@@ -57,36 +102,43 @@ def extract_json_safely(text: str) -> Optional[Dict[str, Any]]:
     Returns:
         Parsed JSON dict or None
     """
-    if not text or not text.strip():
+    if not text:
+        return None
+    
+    # Every strategy below needs an object; bail out before raising any JSONDecodeError
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end <= start:
         return None
     
-    # Strategy 1: Try direct parsing
+    # Strategy 1: Parse the span from the first '{' to the last '}' (covers bare JSON,
+    # leading prose and markdown fences without any regex work)
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text[start:end + 1])
+    except orjson.JSONDecodeError:
         pass
     
     # Strategy 2: Sanitize and try again
     try:
         cleaned = sanitize_json_string(text)
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         pass
     
-    # Strategy 3: Find JSON object and try parsing
+    # Strategy 3: Parse the first balanced object on its own
     try:
-        match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
-        if match:
-            return json.loads(match.group(0))
-    except json.JSONDecodeError:
+        candidate = _first_balanced_object(text, start)
+        if candidate:
+            return orjson.loads(candidate)
+    except orjson.JSONDecodeError:
         pass
     
     # Strategy 4: Try fixing common newline issues in strings
     try:
         # Replace newlines within strings with spaces
-        fixed = re.sub(r':\s*"([^"]*\n[^"]*)"', lambda m: f': "{m.group(1).replace(chr(10), " ")}"', text)
-        return json.loads(fixed)
-    except json.JSONDecodeError:
+        fixed = _RE_MULTILINE_VALUE.sub(lambda m: f': "{m.group(1).replace(chr(10), " ")}"', text)
+        return orjson.loads(fixed)
+    except orjson.JSONDecodeError:
         pass
     
     return None
@@ -102,18 +154,14 @@ def validate_paper_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Validated and fixed data dict
     """
-    # Ensure required fields exist with correct types
-    validated = {
-        'title': str(data.get('title', 'Untitled')),
-        'authors': data.get('authors') if isinstance(data.get('authors'), list) else [],
-        'overview': data.get('overview') if isinstance(data.get('overview'), str) else None,
-    }
-    
-    # Clean up empty strings to None
-    if validated['overview'] == '':
-        validated['overview'] = None
-    
-    # Ensure authors array doesn't contain None or empty strings
-    validated['authors'] = [a for a in validated['authors'] if a]
-    
-    return validated
\ No newline at end of file
+    title = data.get('title', 'Untitled')
+    authors = data.get('authors')
+    overview = data.get('overview')
+    
+    # Ensure required fields exist with correct types; authors keeps only non-empty
+    # strings and empty overviews become None, all in a single pass
+    return {
+        'title': title if isinstance(title, str) else str(title),
+        'authors': [a for a in authors if isinstance(a, str) and a] if isinstance(authors, list) else [],
+        'overview': overview if isinstance(overview, str) and overview else None,
+    }
\ No newline at end of file
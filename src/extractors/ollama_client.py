@@ -1,40 +1,89 @@
 """Ollama API client for vision and text models."""
-import base64
+import json
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
-import requests
+from typing import Dict, Any, Optional
+
+try:
+    import pybase64 as base64  # SIMD encoder, drop-in for the stdlib API
+except ImportError:
+    import base64
 
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
     
     def __init__(self, base_url: str = "http://localhost:11434",
-                 model_name: str = "llama3.2-vision:11b", timeout: int = 300):
+                 model_name: str = "llama3.2-vision:11b", timeout: int = 300,
+                 pool_size: int = 8):
         self.base_url = base_url
         self.model_name = model_name
         self.timeout = timeout
         self.api_url = f"{base_url}/api/generate"
+        
+        # check_connection trusts a successful health check for this many seconds
+        # (None = never checked or invalidated; monotonic time has no fixed origin)
+        self._last_ok_ts: Optional[float] = None
+        self._ok_ttl: float = 30.0
+        
+        self.pool_size = pool_size
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self):
+        """HTTP session, created (and requests imported) on first use."""
+        if self._session is None:
+            # Batch extraction calls this from several threads at once; build only one session
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    # Reuse keep-alive connections instead of opening one per request
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def analyze_image(self, image_path: Path, prompt: str,
                      temperature: float = 0.1, max_tokens: int = 2000) -> Dict[str, Any]:
         """Analyze image with vision model."""
         try:
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
+            image_base64 = base64.b64encode(self._read_file(image_path))
         except Exception as e:
             return {'success': False, 'error': f"Failed to read image: {e}", 'response': None}
         
         payload = {
             'model': self.model_name,
             'prompt': prompt,
-            'images': [image_base64],
             'stream': False,
             'options': {'temperature': temperature, 'num_predict': max_tokens}
         }
+        body = self._json_body_with_image(payload, image_base64)
+        session = self.session
+        import requests  # already loaded by the session property
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=self.timeout)
+            response = session.post(self.api_url, data=body, timeout=self.timeout,
+                                    headers={'Content-Type': 'application/json'})
             response.raise_for_status()
             result = response.json()
             
@@ -46,12 +95,39 @@ class OllamaClient:
                 'error': None
             }
         except requests.exceptions.ConnectionError:
+            self._last_ok_ts = None  # force the next check_connection to hit the server
             return {'success': False, 'error': 'Cannot connect to Ollama. Is it running?', 'response': None}
         except requests.exceptions.Timeout:
             return {'success': False, 'error': f'Request timed out after {self.timeout}s', 'response': None}
         except Exception as e:
             return {'success': False, 'error': str(e), 'response': None}
     
+    @staticmethod
+    def _read_file(path: Path) -> memoryview:
+        """Read a whole file into one preallocated buffer."""
+        with open(path, 'rb', buffering=0) as f:
+            buffer = bytearray(os.fstat(f.fileno()).st_size)
+            view = memoryview(buffer)
+            read = 0
+            while read < len(buffer):
+                n = f.readinto(view[read:])
+                if not n:
+                    break
+                read += n
+        return view[:read]
+    
+    @staticmethod
+    def _json_body_with_image(payload: Dict[str, Any], image_base64: bytes) -> bytes:
+        """
+        Serialize payload to JSON with an 'images' entry holding the encoded image.
+        
+        Base64 output is plain ASCII that never needs JSON escaping, so the bytes
+        are spliced in directly instead of being decoded to str, scanned by the
+        JSON encoder and encoded back to bytes.
+        """
+        head = json.dumps(payload)[:-1].encode('utf-8')  # drop the closing brace
+        return b''.join((head, b', "images": ["', image_base64, b'"]}'))
+    
     def generate_text(self, prompt: str, temperature: float = 0.1,
                      max_tokens: int = 4000) -> Dict[str, Any]:
         """Generate text without image."""
@@ -63,7 +139,7 @@ class OllamaClient:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=self.timeout)
+            response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             result = response.json()
             return {'success': True, 'response': result.get('response', ''), 'error': None}
@@ -71,9 +147,15 @@ class OllamaClient:
             return {'success': False, 'error': str(e), 'response': None}
     
     def check_connection(self) -> bool:
-        """Check if Ollama server is running."""
+        """Check if Ollama server is running (cached for a short TTL after success)."""
+        if self._last_ok_ts is not None and time.monotonic() - self._last_ok_ts < self._ok_ttl:
+            return True
+        
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
+            ok = response.status_code == 200
         except:
-            return False
\ No newline at end of file
+            ok = False
+        
+        self._last_ok_ts = time.monotonic() if ok else None
+        return ok
\ No newline at end of file
@@ -1,19 +1,19 @@
 """Extract detailed overview from PDF files using Ollama."""
 from pathlib import Path
 from typing import Optional
-import yaml
-import fitz  # PyMuPDF
 
+from ..core.conference import load_config
 from .ollama_client import OllamaClient
 
+# Characters of paper text sent to the model
+MAX_PROMPT_CHARS = 8000
+
 
 class PDFExtractor:
     """Extract detailed paper information from PDFs."""
     
     def __init__(self, config_path: str = "config/config.yaml"):
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        model_name = config['model']['name']
+        model_name = load_config(config_path)['model']['name']
         self.client = OllamaClient(model_name=model_name)
     
     def extract_detailed_overview(self, pdf_path: Path, max_pages: int = 5) -> Optional[str]:
@@ -31,7 +31,7 @@ class PDFExtractor:
             prompt = f"""Analyze this research paper text and provide a detailed overview.
 
 Paper text:
-{text[:8000]}
+{text[:MAX_PROMPT_CHARS]}
 
 Provide a comprehensive overview including:
 1. **Problem Statement**: What problem does this paper address? Why is it important?
@@ -63,21 +63,24 @@ Format as clear paragraphs with bold headings."""
             print(f"Error processing PDF: {e}")
             return None
     
-    def _extract_text_from_pdf(self, pdf_path: Path, max_pages: int = 5) -> str:
-        """Extract text from PDF pages."""
-        text: str = ""
+    def _extract_text_from_pdf(self, pdf_path: Path, max_pages: int = 5,
+                               max_chars: int = MAX_PROMPT_CHARS) -> str:
+        """Extract text from PDF pages, stopping once max_chars have been collected."""
+        parts = []
+        total = 0
         
         try:
-            pdf_document = fitz.open(str(pdf_path))
-            
-            for page_num in range(min(max_pages, len(pdf_document))):
-                page = pdf_document[page_num]
-                text += str(page.get_text("text"))
-                text += "\n\n"  # Separate pages
+            import fitz  # PyMuPDF, deferred so importing this module stays cheap
             
-            pdf_document.close()
+            with fitz.open(str(pdf_path)) as pdf_document:
+                for page_num in range(min(max_pages, len(pdf_document))):
+                    page_text = str(pdf_document[page_num].get_text("text"))
+                    parts.append(page_text)
+                    total += len(page_text) + 2
+                    if total >= max_chars:
+                        break  # the prompt can't use any more text
             
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
         
-        return text.strip()
\ No newline at end of file
+        return "\n\n".join(parts).strip()[:max_chars]  # Separate pages
\ No newline at end of file
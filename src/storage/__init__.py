@@ -1,5 +1,5 @@
 """Data storage and persistence modules."""
-from .database import PaperDatabase
+from .database import PaperDatabase, get_default_database
 from .pdf_matcher import PDFMatcher
 
-__all__ = ['PaperDatabase', 'PDFMatcher']
\ No newline at end of file
+__all__ = ['PaperDatabase', 'get_default_database', 'PDFMatcher']
\ No newline at end of file
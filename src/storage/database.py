@@ -1,27 +1,145 @@
 """SQLite database for storing paper metadata."""
+import atexit
 import sqlite3
-import json
+import os
+import orjson
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator, Tuple
 from datetime import datetime
 import threading
+from functools import lru_cache
 
 from ..core.models import PaperMetadata, Author
 
+# Source files with these extensions can be previewed as images in the UI
+PREVIEW_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+
+
+def _source_display_info(source_file: Optional[str]) -> tuple:
+    """
+    Derive the UI path and image flag for a paper's first source file.
+    
+    Absolute (possibly Windows) paths are cut down to the part from the
+    'data' directory onwards and normalized to forward slashes.
+    
+    Returns:
+        (relative_path, is_image) tuple; (None, False) without a source file
+    """
+    if not source_file:
+        return None, False
+    
+    data_idx = source_file.lower().find('data')
+    rel_path = source_file[data_idx:].replace('\\', '/') if data_idx != -1 else source_file
+    
+    return rel_path, os.path.splitext(rel_path)[1].lower() in PREVIEW_IMAGE_EXTENSIONS
+
+
+@lru_cache(maxsize=4)
+def get_default_database(db_path: str = "data/database/papers.db") -> "PaperDatabase":
+    """
+    Get the process-wide PaperDatabase for a path, opening it on first use.
+    
+    Each thread gets its own connection, reused from finished threads where
+    possible, so reads run in parallel under WAL; only writes take the
+    instance lock. Callers share this instance, so none of them close() it;
+    it is closed once, at interpreter exit.
+    """
+    database = PaperDatabase(db_path)
+    atexit.register(database.close)
+    return database
+
 
 class PaperDatabase:
     """Manages paper metadata storage in SQLite."""
     
+    # Allowed ORDER BY clauses for get_papers (never interpolate user input directly)
+    PAPER_ORDERINGS = {
+        'title': 'title ASC',
+        'title_desc': 'title DESC',
+        'newest': 'created_at DESC',
+    }
+    
+    # Connections kept open after their thread finishes, ready for the next one
+    _MAX_IDLE_CONNECTIONS = 8
+    
+    # Ids per IN (...) query, well below SQLite's bound-parameter limit
+    _IN_CHUNK_SIZE = 500
+    
+    # papers_fts tokenizer: stemming, case folding and accent-insensitive matching
+    _FTS_TOKENIZE = 'porter unicode61 remove_diacritics 2'
+    
+    # BM25 column weights for papers_fts (title, authors, overview)
+    _FTS_WEIGHTS = (10.0, 5.0, 1.0)
+    
+    # Row source for papers_fts; callers append a WHERE clause if needed
+    _FTS_ROW_SELECT = """
+        SELECT p.rowid, p.title,
+               COALESCE((SELECT GROUP_CONCAT(a.name, ' ')
+                         FROM paper_authors pa JOIN authors a ON a.author_id = pa.author_id
+                         WHERE pa.paper_id = p.paper_id), ''),
+               COALESCE(p.overview, '')
+        FROM papers p
+    """
+    
     def __init__(self, db_path: str = "data/database/papers.db"):
         """Initialize database connection."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False) # check_same_thread=False is required to make changes from different tabs
-        self.conn.row_factory = sqlite3.Row
+        # One connection per thread: WAL lets readers run in parallel, so only
+        # writes are serialized, through _lock
+        self._local = threading.local()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        # Warm connections left behind by finished threads, handed to new ones
+        self._idle_connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._lock = threading.Lock()
         self._create_tables()
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Register a connection for the current thread, reusing an idle one if possible."""
+        with self._connections_lock:
+            # Streamlit runs every rerun on a fresh thread; reclaim connections of finished ones
+            for thread in [t for t in self._connections if not t.is_alive()]:
+                dead_conn = self._connections.pop(thread)
+                if len(self._idle_connections) < self._MAX_IDLE_CONNECTIONS:
+                    self._idle_connections.append(dead_conn)
+                else:
+                    dead_conn.close()
+            conn = self._idle_connections.pop() if self._idle_connections else None
+        
+        if conn is None:
+            # check_same_thread=False lets a connection outlive its thread and be reused or closed elsewhere
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+        
+        with self._connections_lock:
+            self._connections[threading.current_thread()] = conn
+        return conn
+    
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Tune SQLite for a read-heavy workload with occasional writes."""
+        cursor = conn.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")  # readers don't block on writers
+        except sqlite3.OperationalError as e:
+            print(f"Could not enable WAL mode: {e}")
+        cursor.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, avoids an fsync per commit
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA busy_timeout=5000")  # wait for other writers (e.g. a second tab) instead of failing
+    
     def _create_tables(self):
         """Create database tables if they don't exist."""
         with self._lock:
@@ -39,7 +157,9 @@ class PaperDatabase:
                     pdf_url TEXT,
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
-                    version INTEGER DEFAULT 1
+                    version INTEGER DEFAULT 1,
+                    source_rel_path TEXT,
+                    source_is_image BOOLEAN DEFAULT 0
                 )
             """)
             
@@ -51,16 +171,8 @@ class PaperDatabase:
                 )
             """)
             
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS paper_authors (
-                    paper_id TEXT,
-                    author_id INTEGER,
-                    author_order INTEGER,
-                    FOREIGN KEY (paper_id) REFERENCES papers(paper_id),
-                    FOREIGN KEY (author_id) REFERENCES authors(author_id),
-                    PRIMARY KEY (paper_id, author_id)
-                )
-            """)
+            cursor.execute(self._PAPER_AUTHORS_DDL.format(table='paper_authors'))
+            self._migrate_paper_authors_without_rowid(cursor)
             
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS source_files (
@@ -81,51 +193,191 @@ class PaperDatabase:
                 )
             """)
             
+            self._add_source_display_columns(cursor)
+            
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_papers_conf_created'")
+            indexes_existed = cursor.fetchone() is not None
+            
+            # (conference_name, created_at) serves conference filters and their newest-first sorts;
+            # it supersedes the older single-column conference index
+            cursor.execute("DROP INDEX IF EXISTS idx_papers_conf")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_papers_conf_created ON papers(conference_name, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_papers_created ON papers(created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_papers_pdf_found ON papers(pdf_found) WHERE pdf_found = 1")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_papers_missing_pdf ON papers(conference_name) WHERE pdf_found = 0")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors(author_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_files_paper ON source_files(paper_id)")
+            
+            if not indexes_existed:
+                cursor.execute("ANALYZE")  # give the planner statistics for the new indexes
+            
+            # Full-text search index over title, authors and overview (rowid = papers.rowid)
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'papers_fts'")
+            fts_row = cursor.fetchone()
+            fts_existed = fts_row is not None
+            if fts_existed and self._FTS_TOKENIZE not in fts_row[0]:
+                # Built with an older tokenizer; recreate it and re-index below
+                cursor.execute("DROP TABLE papers_fts")
+                fts_existed = False
+            try:
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                        title, authors, overview,
+                        tokenize='{self._FTS_TOKENIZE}'
+                    )
+                """)
+                self._fts_enabled = True
+            except sqlite3.OperationalError as e:
+                print(f"FTS5 unavailable, falling back to LIKE search: {e}")
+                self._fts_enabled = False
+            
+            if self._fts_enabled and not fts_existed:
+                self._rebuild_search_index(cursor)
+            
             self.conn.commit()
     
+    # Junction table keyed by its composite primary key (WITHOUT ROWID = clustered on the key)
+    _PAPER_AUTHORS_DDL = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            paper_id TEXT,
+            author_id INTEGER,
+            author_order INTEGER,
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id),
+            FOREIGN KEY (author_id) REFERENCES authors(author_id),
+            PRIMARY KEY (paper_id, author_id)
+        ) WITHOUT ROWID
+    """
+    
+    def _migrate_paper_authors_without_rowid(self, cursor: sqlite3.Cursor):
+        """Rebuild a paper_authors table created before it was WITHOUT ROWID."""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'paper_authors'")
+        if 'WITHOUT ROWID' in cursor.fetchone()[0].upper():
+            return
+        
+        cursor.execute("DROP TABLE IF EXISTS paper_authors_new")
+        cursor.execute(self._PAPER_AUTHORS_DDL.format(table='paper_authors_new'))
+        cursor.execute("""
+            INSERT OR REPLACE INTO paper_authors_new (paper_id, author_id, author_order)
+            SELECT paper_id, author_id, author_order FROM paper_authors
+        """)
+        cursor.execute("DROP TABLE paper_authors")  # also drops its indexes; recreated below
+        cursor.execute("ALTER TABLE paper_authors_new RENAME TO paper_authors")
+    
+    def _add_source_display_columns(self, cursor: sqlite3.Cursor):
+        """Add and backfill source_rel_path / source_is_image on databases created before they existed."""
+        cursor.execute("PRAGMA table_info(papers)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'source_rel_path' in columns:
+            return
+        
+        cursor.execute("ALTER TABLE papers ADD COLUMN source_rel_path TEXT")
+        cursor.execute("ALTER TABLE papers ADD COLUMN source_is_image BOOLEAN DEFAULT 0")
+        
+        cursor.execute("""
+            SELECT paper_id, file_path FROM source_files
+            WHERE file_id IN (SELECT MIN(file_id) FROM source_files GROUP BY paper_id)
+        """)
+        updates = [(*_source_display_info(file_path), paper_id) for paper_id, file_path in cursor.fetchall()]
+        cursor.executemany("""
+            UPDATE papers SET source_rel_path = ?, source_is_image = ? WHERE paper_id = ?
+        """, updates)
+    
+    def _rebuild_search_index(self, cursor: sqlite3.Cursor):
+        """Repopulate the full-text index from the papers table."""
+        cursor.execute("DELETE FROM papers_fts")
+        cursor.execute(f"INSERT INTO papers_fts (rowid, title, authors, overview) {self._FTS_ROW_SELECT}")
+    
+    def _unindex_papers(self, cursor: sqlite3.Cursor, paper_ids: List[str]):
+        """Remove papers from the full-text index (call before their papers rows change rowid)."""
+        if self._fts_enabled:
+            cursor.executemany("""
+                DELETE FROM papers_fts WHERE rowid IN (SELECT rowid FROM papers WHERE paper_id = ?)
+            """, [(paper_id,) for paper_id in paper_ids])
+    
+    def _index_papers(self, cursor: sqlite3.Cursor, paper_ids: List[str]):
+        """Add papers' current title, authors and overview to the full-text index."""
+        if self._fts_enabled:
+            cursor.executemany(f"""
+                INSERT INTO papers_fts (rowid, title, authors, overview)
+                {self._FTS_ROW_SELECT} WHERE p.paper_id = ?
+            """, [(paper_id,) for paper_id in paper_ids])
+    
+    _INSERT_PAPER_SQL = """
+        INSERT OR REPLACE INTO papers (
+            paper_id, title, overview, conference_name, pdf_found, pdf_path, pdf_url,
+            created_at, updated_at, version, source_rel_path, source_is_image
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def _write_papers(self, cursor: sqlite3.Cursor, papers: List[PaperMetadata]):
+        """Insert or replace papers with their authors and source files (caller commits)."""
+        now_iso = datetime.now().isoformat()
+        paper_ids = list(dict.fromkeys(paper.paper_id for paper in papers))
+        
+        # INSERT OR REPLACE gives the row a new rowid, so drop the old index entries first
+        self._unindex_papers(cursor, paper_ids)
+        
+        paper_rows = []
+        for paper in papers:
+            source_rel_path, source_is_image = _source_display_info(
+                paper.source_files[0] if paper.source_files else None
+            )
+            paper_rows.append((
+                paper.paper_id,
+                paper.title,
+                paper.overview,
+                paper.conference_name,
+                paper.pdf_found,
+                paper.pdf_path,
+                paper.pdf_url,
+                paper.created_at.isoformat(),
+                now_iso,
+                paper.version,
+                source_rel_path,
+                source_is_image
+            ))
+        cursor.executemany(self._INSERT_PAPER_SQL, paper_rows)
+        
+        author_names = [author.name for paper in papers for author in paper.authors]
+        if author_names:
+            cursor.executemany("""
+                INSERT OR IGNORE INTO authors (name) VALUES (?)
+            """, [(name,) for name in author_names])
+            
+            # One lookup per chunk of names instead of one SELECT per author
+            author_ids: Dict[str, int] = {}
+            unique_names = list(dict.fromkeys(author_names))
+            for start in range(0, len(unique_names), self._IN_CHUNK_SIZE):
+                chunk = unique_names[start:start + self._IN_CHUNK_SIZE]
+                cursor.execute(
+                    f"SELECT name, author_id FROM authors WHERE name IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                author_ids.update(cursor.fetchall())
+            
+            cursor.executemany("""
+                INSERT OR REPLACE INTO paper_authors (paper_id, author_id, author_order)
+                VALUES (?, ?, ?)
+            """, [
+                (paper.paper_id, author_ids[author.name], order)
+                for paper in papers for order, author in enumerate(paper.authors)
+            ])
+        
+        cursor.executemany("""
+            INSERT OR IGNORE INTO source_files (paper_id, file_path, file_type)
+            VALUES (?, ?, ?)
+        """, [(paper.paper_id, source_file, 'image') for paper in papers for source_file in paper.source_files])
+        
+        self._index_papers(cursor, paper_ids)
+    
     def save_paper(self, paper: PaperMetadata) -> bool:
+        return self.save_papers_bulk([paper])
+    
+    def save_papers_bulk(self, papers: List[PaperMetadata]) -> bool:
+        """Save several papers in one transaction (a single commit for the whole batch)."""
         with self._lock:
             try:
-                cursor = self.conn.cursor()
-                
-                cursor.execute("""
-                    INSERT OR REPLACE INTO papers (
-                        paper_id, title, overview, conference_name, pdf_found, pdf_path, pdf_url,
-                        created_at, updated_at, version
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    paper.paper_id,
-                    paper.title,
-                    paper.overview,
-                    paper.conference_name,
-                    paper.pdf_found,
-                    paper.pdf_path,
-                    paper.pdf_url,
-                    paper.created_at.isoformat(),
-                    datetime.now().isoformat(),
-                    paper.version
-                ))
-                
-
-                for order, author in enumerate(paper.authors):
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO authors (name) VALUES (?)
-                    """, (author.name,))
-                    
-                    cursor.execute("SELECT author_id FROM authors WHERE name = ?", (author.name,))
-                    author_id = cursor.fetchone()[0]
-                    
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO paper_authors (paper_id, author_id, author_order)
-                        VALUES (?, ?, ?)
-                    """, (paper.paper_id, author_id, order))
-                
-                for source_file in paper.source_files:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO source_files (paper_id, file_path, file_type)
-                        VALUES (?, ?, ?)
-                    """, (paper.paper_id, source_file, 'image'))
-                
+                self._write_papers(self.conn.cursor(), papers)
                 self.conn.commit()
                 return True
                 
@@ -134,89 +386,240 @@ class PaperDatabase:
                 self.conn.rollback()
                 return False
     
+    def delete_paper(self, paper_id: str) -> bool:
+        """Delete a paper with its author links, source files and search index entry."""
+        with self._lock:
+            try:
+                cursor = self.conn.cursor()
+                self._unindex_papers(cursor, [paper_id])
+                cursor.execute("DELETE FROM paper_authors WHERE paper_id = ?", (paper_id,))
+                cursor.execute("DELETE FROM source_files WHERE paper_id = ?", (paper_id,))
+                cursor.execute("DELETE FROM papers WHERE paper_id = ?", (paper_id,))
+                self.conn.commit()
+                return cursor.rowcount > 0
+                
+            except Exception as e:
+                print(f"Error deleting paper: {e}")
+                self.conn.rollback()
+                return False
+    
     def get_paper(self, paper_id: str) -> Optional[PaperMetadata]:
         """Retrieve a paper by ID."""
-        with self._lock:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("SELECT * FROM papers WHERE paper_id = ?", (paper_id,))
-            row = cursor.fetchone()
-            
-            if not row:
-                return None
+        cursor = self.conn.cursor()
+        
+        cursor.execute("SELECT * FROM papers WHERE paper_id = ?", (paper_id,))
+        row = cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        return self._row_to_paper(cursor, row)
+    
+    def _row_to_paper(self, cursor: sqlite3.Cursor, row: sqlite3.Row) -> PaperMetadata:
+        """Build a PaperMetadata from a papers row, loading its authors and source files."""
+        return self._rows_to_papers(cursor, [row])[0]
+    
+    def _rows_to_papers(self, cursor: sqlite3.Cursor, rows: List[sqlite3.Row]) -> List[PaperMetadata]:
+        """
+        Build PaperMetadata objects from papers rows, keeping their order.
+        
+        Authors and source files for all rows are loaded with one query each
+        (per chunk of ids) instead of two queries per paper.
+        """
+        authors_by_paper: Dict[str, List[Author]] = {}
+        files_by_paper: Dict[str, List[str]] = {}
+        
+        paper_ids = [row['paper_id'] for row in rows]
+        for start in range(0, len(paper_ids), self._IN_CHUNK_SIZE):
+            chunk = paper_ids[start:start + self._IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
             
-            cursor.execute("""
-                SELECT a.name
+            cursor.execute(f"""
+                SELECT pa.paper_id, a.name
                 FROM authors a
                 JOIN paper_authors pa ON a.author_id = pa.author_id
-                WHERE pa.paper_id = ?
-                ORDER BY pa.author_order
-            """, (paper_id,))
+                WHERE pa.paper_id IN ({placeholders})
+                ORDER BY pa.paper_id, pa.author_order
+            """, chunk)
+            for paper_id, name in cursor.fetchall():
+                authors_by_paper.setdefault(paper_id, []).append(Author(name=name))
             
-            authors = [Author(name=r[0]) for r in cursor.fetchall()]
-            
-            cursor.execute("""
-                SELECT file_path FROM source_files WHERE paper_id = ?
-            """, (paper_id,))
-            
-            source_files = [r[0] for r in cursor.fetchall()]
-            
-            paper = PaperMetadata(
+            cursor.execute(f"""
+                SELECT paper_id, file_path FROM source_files
+                WHERE paper_id IN ({placeholders})
+                ORDER BY file_id
+            """, chunk)
+            for paper_id, file_path in cursor.fetchall():
+                files_by_paper.setdefault(paper_id, []).append(file_path)
+        
+        return [
+            PaperMetadata(
                 paper_id=row['paper_id'],
                 title=row['title'],
-                authors=authors,
+                authors=authors_by_paper.get(row['paper_id'], []),
                 overview=row['overview'],
                 conference_name=row['conference_name'],
                 pdf_found=bool(row['pdf_found']),
                 pdf_path=row['pdf_path'],
                 pdf_url=row['pdf_url'],
-                source_files=source_files,
+                source_files=files_by_paper.get(row['paper_id'], []),
                 created_at=datetime.fromisoformat(row['created_at']),
                 updated_at=datetime.fromisoformat(row['updated_at']),
-                version=row['version']
+                version=row['version'],
+                source_rel_path=row['source_rel_path'],
+                source_is_image=bool(row['source_is_image'])
             )
-            
-            return paper
+            for row in rows
+        ]
+    
+    def _hydrate_papers(self, cursor: sqlite3.Cursor, paper_ids: List[str]) -> List[PaperMetadata]:
+        """Load full papers for the given ids, in the same order (missing ids are skipped)."""
+        rows_by_id: Dict[str, sqlite3.Row] = {}
+        for start in range(0, len(paper_ids), self._IN_CHUNK_SIZE):
+            chunk = paper_ids[start:start + self._IN_CHUNK_SIZE]
+            cursor.execute(
+                f"SELECT * FROM papers WHERE paper_id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            rows_by_id.update((row['paper_id'], row) for row in cursor.fetchall())
+        
+        return self._rows_to_papers(cursor, [rows_by_id[pid] for pid in paper_ids if pid in rows_by_id])
+    
+    def get_recent_papers(self, limit: int) -> Iterator[PaperMetadata]:
+        """Yield the most recently added papers, newest first, hydrating _IN_CHUNK_SIZE rows at a time."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM papers ORDER BY created_at DESC LIMIT ?", (limit,))
+        # Authors and source files are looked up on a second cursor, so `cursor` keeps its place
+        lookup_cursor = self.conn.cursor()
+        while True:
+            rows = cursor.fetchmany(self._IN_CHUNK_SIZE)
+            if not rows:
+                return
+            yield from self._rows_to_papers(lookup_cursor, rows)
     
     def get_all_papers(self) -> List[PaperMetadata]:
-        with self._lock:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT paper_id FROM papers")
-            paper_ids = [row[0] for row in cursor.fetchall()]
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM papers")
+        return self._rows_to_papers(cursor, cursor.fetchall())
+    
+    def get_missing_papers(self, conference_name: Optional[str] = None) -> List[PaperMetadata]:
+        """Get papers without a PDF, optionally only from one conference."""
+        sql = "SELECT * FROM papers WHERE pdf_found = 0"
+        params: list = []
+        if conference_name:
+            sql += " AND conference_name = ?"
+            params.append(conference_name)
         
-        return [p for p in (self.get_paper(pid) for pid in paper_ids) if p is not None]
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return self._rows_to_papers(cursor, cursor.fetchall())
     
-    def search_papers(self, query: str) -> List[PaperMetadata]:
-        """Search papers by title, author, or overview."""
-        with self._lock:
-            cursor = self.conn.cursor()
-            
-            query_lower = f"%{query.lower()}%"
-            
-            # Search in titles
-            cursor.execute("""
-                SELECT DISTINCT paper_id FROM papers 
-                WHERE LOWER(title) LIKE ?
-            """, (query_lower,))
-            paper_ids = set(row[0] for row in cursor.fetchall())
-            
-            # Search in authors
-            cursor.execute("""
-                SELECT DISTINCT pa.paper_id
-                FROM authors a
-                JOIN paper_authors pa ON a.author_id = pa.author_id
-                WHERE LOWER(a.name) LIKE ?
-            """, (query_lower,))
-            paper_ids.update(row[0] for row in cursor.fetchall())
-            
-            # Search in overview
-            cursor.execute("""
-                SELECT DISTINCT paper_id FROM papers 
-                WHERE LOWER(overview) LIKE ?
-            """, (query_lower,))
-            paper_ids.update(row[0] for row in cursor.fetchall())
+    def get_papers(self, conference: Optional[str] = None, pdf_only: bool = False,
+                   order_by: str = 'newest', limit: Optional[int] = None) -> List[PaperMetadata]:
+        """Get papers filtered by conference / PDF availability and sorted in SQL."""
+        if order_by not in self.PAPER_ORDERINGS:
+            raise ValueError(f"Unknown ordering: {order_by}")
+        
+        clauses = []
+        params: list = []
+        if conference is not None:
+            clauses.append("conference_name = ?")
+            params.append(conference)
+        if pdf_only:
+            clauses.append("pdf_found = 1")
         
-        return [p for p in (self.get_paper(pid) for pid in paper_ids) if p is not None]
+        sql = "SELECT * FROM papers"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {self.PAPER_ORDERINGS[order_by]}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return self._rows_to_papers(cursor, cursor.fetchall())
+    
+    def search_papers(self, query: str, limit: int = 100,
+                      conference: Optional[str] = None) -> List[PaperMetadata]:
+        """Search papers by title, author, or overview (best matches first), optionally within one conference."""
+        if not self._fts_enabled:
+            papers = self._search_papers_like(query)
+            if conference is not None:
+                papers = [p for p in papers if p.conference_name == conference]
+            return papers
+        
+        # Quote every term so user input can't inject FTS5 syntax; trailing * keeps prefix matching
+        terms = ['"' + term.replace('"', '""') + '"*' for term in query.split()]
+        if not terms:
+            return []
+        
+        cursor = self.conn.cursor()
+        try:
+            if conference is None:
+                cursor.execute("""
+                    SELECT p.*
+                    FROM papers_fts f
+                    JOIN papers p ON p.rowid = f.rowid
+                    WHERE papers_fts MATCH ?
+                    ORDER BY bm25(papers_fts, ?, ?, ?)
+                    LIMIT ?
+                """, (" ".join(terms), *self._FTS_WEIGHTS, limit))
+            else:
+                # Rank inside a CTE first: its LIMIT keeps SQLite from flattening the MATCH into
+                # the filtered join, which can make it scan the FTS table instead of using its index.
+                # Over-fetch so enough candidates survive the conference filter.
+                cursor.execute("""
+                    WITH fts AS (
+                        SELECT rowid, bm25(papers_fts, ?, ?, ?) AS score
+                        FROM papers_fts
+                        WHERE papers_fts MATCH ?
+                        ORDER BY score
+                        LIMIT ?
+                    )
+                    SELECT p.*
+                    FROM fts
+                    JOIN papers p ON p.rowid = fts.rowid
+                    WHERE p.conference_name = ?
+                    ORDER BY fts.score
+                    LIMIT ?
+                """, (*self._FTS_WEIGHTS, " ".join(terms), limit * 10, conference, limit))
+        except sqlite3.OperationalError as e:
+            print(f"Error searching papers: {e}")
+            return []
+        return self._rows_to_papers(cursor, cursor.fetchall())
+    
+    def _search_papers_like(self, query: str) -> List[PaperMetadata]:
+        """Substring search used when SQLite is built without FTS5."""
+        cursor = self.conn.cursor()
+        
+        # LIKE is already case-insensitive for ASCII (the only case LOWER() folds), so
+        # comparing the raw columns gives the same matches without a LOWER() call per row
+        query_lower = f"%{query.lower()}%"
+        
+        # Search in titles
+        cursor.execute("""
+            SELECT DISTINCT paper_id FROM papers 
+            WHERE title LIKE ?
+        """, (query_lower,))
+        paper_ids = set(row[0] for row in cursor.fetchall())
+        
+        # Search in authors
+        cursor.execute("""
+            SELECT DISTINCT pa.paper_id
+            FROM authors a
+            JOIN paper_authors pa ON a.author_id = pa.author_id
+            WHERE a.name LIKE ?
+        """, (query_lower,))
+        paper_ids.update(row[0] for row in cursor.fetchall())
+        
+        # Search in overview
+        cursor.execute("""
+            SELECT DISTINCT paper_id FROM papers 
+            WHERE overview LIKE ?
+        """, (query_lower,))
+        paper_ids.update(row[0] for row in cursor.fetchall())
+        
+        return self._hydrate_papers(cursor, list(paper_ids))
 
     def update_overview(self, paper_id: str, overview: str) -> bool:
         with self._lock:
@@ -229,73 +632,110 @@ class PaperDatabase:
                     WHERE paper_id = ?
                 """, (overview, datetime.now().isoformat(), paper_id))
                 
+                self._unindex_papers(cursor, [paper_id])
+                self._index_papers(cursor, [paper_id])
+                
                 self.conn.commit()
                 return True
             except Exception as e:
                 print(f"Error updating overview: {e}")
+                self.conn.rollback()
                 return False
             
     def get_statistics(self) -> Dict:
-        with self._lock:
-            cursor = self.conn.cursor()
-            
-            stats = {}
-            
-            cursor.execute("SELECT COUNT(*) FROM papers")
-            stats['total_papers'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM papers WHERE pdf_found = 1")
-            stats['papers_with_pdf'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM authors")
-            stats['unique_authors'] = cursor.fetchone()[0]
-            
-            return stats
+        cursor = self.conn.cursor()
+        
+        # One round trip; the PDF count is answered from the partial pdf_found index
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM papers),
+                   (SELECT COUNT(*) FROM papers WHERE pdf_found = 1),
+                   (SELECT COUNT(*) FROM authors)
+        """)
+        total_papers, papers_with_pdf, unique_authors = cursor.fetchone()
+        
+        return {
+            'total_papers': total_papers,
+            'papers_with_pdf': papers_with_pdf,
+            'unique_authors': unique_authors,
+        }
     
     def get_all_conferences(self) -> List[str]:
         """Get list of all unique conference names."""
-        with self._lock:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT DISTINCT conference_name FROM papers WHERE conference_name IS NOT NULL ORDER BY conference_name")
-            return [row[0] for row in cursor.fetchall()]
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT DISTINCT conference_name FROM papers WHERE conference_name IS NOT NULL ORDER BY conference_name")
+        return [row[0] for row in cursor.fetchall()]
+        
+    def get_paper_count(self, conference_name: str) -> int:
+        """Count papers from a specific conference."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM papers WHERE conference_name = ?", (conference_name,))
+        return cursor.fetchone()[0]
         
     def get_conference_papers(self, conference_name: str, limit: Optional[int] = None) -> List[PaperMetadata]:
         """Get all papers from a specific conference."""
-        with self._lock:
-            cursor = self.conn.cursor()
-            
-            if limit:
-                cursor.execute("""
-                    SELECT paper_id FROM papers 
-                    WHERE conference_name = ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (conference_name, limit))
-            else:
-                cursor.execute("""
-                    SELECT paper_id FROM papers 
-                    WHERE conference_name = ?
-                    ORDER BY created_at DESC
-                """, (conference_name,))
-            
-            paper_ids = [row[0] for row in cursor.fetchall()]
-            
-        return [p for p in (self.get_paper(pid) for pid in paper_ids) if p is not None]
+        cursor = self.conn.cursor()
+        
+        if limit:
+            cursor.execute("""
+                SELECT * FROM papers 
+                WHERE conference_name = ?
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (conference_name, limit))
+        else:
+            cursor.execute("""
+                SELECT * FROM papers 
+                WHERE conference_name = ?
+                ORDER BY created_at DESC
+            """, (conference_name,))
+        
+        return self._rows_to_papers(cursor, cursor.fetchall())
+
+    def get_papers_by_conferences(self, conference_names: List[str],
+                                  limit: Optional[int] = None) -> Dict[str, List[PaperMetadata]]:
+        """Get the most recent papers for several conferences in a single query."""
+        if not conference_names:
+            return {}
+        
+        placeholders = ", ".join("?" for _ in conference_names)
+        params: list = list(conference_names)
+        sql = f"""
+            SELECT * FROM (
+                SELECT *,
+                       ROW_NUMBER() OVER (PARTITION BY conference_name ORDER BY created_at DESC) AS rn
+                FROM papers
+                WHERE conference_name IN ({placeholders})
+            )
+        """
+        if limit:
+            sql += " WHERE rn <= ?"
+            params.append(limit)
+        sql += " ORDER BY conference_name, rn"
+        
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        papers = self._rows_to_papers(cursor, cursor.fetchall())
+        
+        papers_by_conference: Dict[str, List[PaperMetadata]] = {name: [] for name in conference_names}
+        for paper in papers:
+            papers_by_conference[paper.conference_name].append(paper)
+        
+        return papers_by_conference
 
     def get_most_recent_conference(self) -> Optional[str]:
         """Get the conference with the most recent papers."""
-        with self._lock:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT conference_name, MAX(created_at) as latest
-                FROM papers
-                WHERE conference_name IS NOT NULL
-                GROUP BY conference_name
-                ORDER BY latest DESC
-                LIMIT 1
-            """)
-            row = cursor.fetchone()
-            return row[0] if row else None
+        cursor = self.conn.cursor()
+        # The conference with the latest MAX(created_at) is the one owning the newest paper,
+        # so walk idx_papers_created from the top instead of grouping every row
+        cursor.execute("""
+            SELECT conference_name
+            FROM papers
+            WHERE conference_name IS NOT NULL
+            ORDER BY created_at DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        return row[0] if row else None
         
     def save_conference_summary(self, conference_name: str, summary: str, paper_count: int) -> bool:
         """Save or update conference summary."""
@@ -312,26 +752,26 @@ class PaperDatabase:
                 return True
             except Exception as e:
                 print(f"Error saving summary: {e}")
+                self.conn.rollback()
                 return False
 
     def get_conference_summary(self, conference_name: str) -> Optional[dict]:
-        """Get stored conference summary."""
-        with self._lock:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT summary, generated_at, paper_count
-                FROM conference_summaries
-                WHERE conference_name = ?
-            """, (conference_name,))
-            
-            row = cursor.fetchone()
-            if row:
-                return {
-                    'summary': row[0],
-                    'generated_at': row[1],
-                    'paper_count': row[2]
-                }
-            return None
+        """Get stored conference summary (generated_at is returned as a datetime)."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT summary, generated_at, paper_count
+            FROM conference_summaries
+            WHERE conference_name = ?
+        """, (conference_name,))
+        
+        row = cursor.fetchone()
+        if row:
+            return {
+                'summary': row[0],
+                'generated_at': datetime.fromisoformat(row[1]),
+                'paper_count': row[2]
+            }
+        return None
 
     def delete_conference_summary(self, conference_name: str) -> bool:
         """Delete conference summary (to force regeneration)."""
@@ -344,6 +784,7 @@ class PaperDatabase:
                 return True
             except Exception as e:
                 print(f"Error deleting summary: {e}")
+                self.conn.rollback()
                 return False
     
     def update_pdf_info(self, paper_id: str, pdf_path: Optional[str] = None, pdf_url: Optional[str] = None) -> bool:
@@ -363,14 +804,75 @@ class PaperDatabase:
                 return True
             except Exception as e:
                 print(f"Error updating PDF info: {e}")
+                self.conn.rollback()
                 return False
     
+    def update_pdf_batch(self, rows: List[Tuple[str, str, str, Optional[str]]]) -> bool:
+        """
+        Record downloaded PDFs and their overviews in one transaction.
+        
+        Args:
+            rows: (paper_id, overview, pdf_path, pdf_url) tuples
+        """
+        if not rows:
+            return True
+        
+        with self._lock:
+            try:
+                cursor = self.conn.cursor()
+                now_iso = datetime.now().isoformat()
+                cursor.executemany("""
+                    UPDATE papers 
+                    SET overview = ?,
+                        pdf_found = 1,
+                        pdf_path = ?,
+                        pdf_url = ?,
+                        updated_at = ?
+                    WHERE paper_id = ?
+                """, [(overview, pdf_path, pdf_url, now_iso, paper_id)
+                      for paper_id, overview, pdf_path, pdf_url in rows])
+                
+                paper_ids = [row[0] for row in rows]
+                self._unindex_papers(cursor, paper_ids)
+                self._index_papers(cursor, paper_ids)
+                
+                self.conn.commit()
+                return True
+            except Exception as e:
+                self.conn.rollback()
+                print(f"Error updating PDF batch: {e}")
+                return False
+    
+    def _iter_paper_chunks(self) -> Iterator[List[PaperMetadata]]:
+        """Yield all papers in rowid order, _IN_CHUNK_SIZE at a time."""
+        last_rowid = 0
+        while True:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT rowid, * FROM papers WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, self._IN_CHUNK_SIZE)
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            papers = self._rows_to_papers(cursor, rows)
+            
+            last_rowid = rows[-1][0]
+            yield papers
+    
     def export_to_json(self, output_path: Path):
-        papers = self.get_all_papers()
-        papers_dict = [paper.model_dump(mode='json') for paper in papers]
+        """Write all papers to a JSON array, streaming one chunk of papers at a time."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(papers_dict, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(b'[')
+            first = True
+            for papers in self._iter_paper_chunks():
+                for paper in papers:
+                    item = orjson.dumps(paper.model_dump(mode='json'), option=orjson.OPT_INDENT_2)
+                    # Nest the object one level inside the array, matching json.dump(indent=2)
+                    f.write((b'\n  ' if first else b',\n  ') + item.replace(b'\n', b'\n  '))
+                    first = False
+            f.write(b']' if first else b'\n]')
     
     def add_pdf_url_column(self):
         """Add pdf_url column if it doesn't exist."""
@@ -384,5 +886,13 @@ class PaperDatabase:
                 pass  # Column already exists
             
     def close(self):
-        with self._lock:
-            self.conn.close()
\ No newline at end of file
+        with self._lock, self._connections_lock:
+            for conn in [*self._connections.values(), *self._idle_connections]:
+                try:
+                    conn.execute("PRAGMA optimize")  # refresh query planner statistics if needed
+                except sqlite3.Error:
+                    pass
+                conn.close()
+            self._connections.clear()
+            self._idle_connections.clear()
+            self._local = threading.local()
\ No newline at end of file
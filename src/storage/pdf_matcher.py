@@ -1,10 +1,18 @@
 """Match extracted papers with local PDF files."""
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
 
 from ..core.models import PaperMetadata, SourceFile
 
+# Common words dropped from titles and names before comparison
+_STOP_WORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+
+# Anything that isn't alphanumeric or '_' (same as str.isalnum, Unicode-aware)
+_NON_WORD_RE = re.compile(r'\W+')
+
 
 class PDFMatcher:
     """Match papers to PDF files by filename similarity."""
@@ -40,29 +48,66 @@ class PDFMatcher:
         if not pdf_files:
             return None
         
-        # Generate search strings from paper metadata
-        search_strings = self._generate_search_strings(paper)
+        pdf_names = self._pdf_names(pdf_files)
+        return self._best_match(paper, pdf_files, pdf_names, self._exact_names(pdf_files, pdf_names))
+    
+    def _pdf_names(self, pdf_files: List[SourceFile]) -> List[str]:
+        """Get lowercased filenames without extension, in pdf_files order."""
+        return [pdf_file.file_path.stem.lower() for pdf_file in pdf_files]
+    
+    def _exact_names(self, pdf_files: List[SourceFile], pdf_names: List[str]) -> Dict[str, int]:
+        """
+        Map filenames to their index in pdf_files for exact-match lookups.
+        
+        Holds each lowercased stem and its _clean_string form; raw stems win
+        over cleaned forms, and earlier files win over later ones.
+        """
+        exact: Dict[str, int] = {}
+        for i, name in enumerate(pdf_names):
+            exact.setdefault(name, i)
+        for i, pdf_file in enumerate(pdf_files):
+            exact.setdefault(self._clean_string(pdf_file.file_path.stem), i)
+        return exact
+    
+    def _best_match(self,
+                    paper: PaperMetadata,
+                    pdf_files: List[SourceFile],
+                    pdf_names: List[str],
+                    exact: Dict[str, int]) -> Optional[SourceFile]:
+        """
+        Score a paper's search strings against precomputed PDF names.
         
-        best_match = None
-        best_score = 0.0
+        A search string equal to a filename (or its cleaned form) is returned
+        straight away. Otherwise each search string is scored against every
+        name in one rapidfuzz call, which runs in C and skips names that can't
+        reach the threshold.
         
-        for pdf_file in pdf_files:
-            # Get filename without extension
-            pdf_name = pdf_file.file_path.stem.lower()
+        Args:
+            paper: Paper to match
+            pdf_files: Available PDF files
+            pdf_names: Output of _pdf_names(pdf_files)
+            exact: Output of _exact_names(pdf_files, pdf_names)
             
-            # Compare with each search string
-            for search_str in search_strings:
-                score = self._calculate_similarity(search_str, pdf_name)
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = pdf_file
-        
-        # Return match only if above threshold
-        if best_score >= self.similarity_threshold:
-            return best_match
-        
-        return None
+        Returns:
+            Best matching SourceFile at or above the threshold, or None
+        """
+        search_strings = self._generate_search_strings(paper)
+        for search_str in search_strings:
+            if search_str in exact:
+                return pdf_files[exact[search_str]]
+        
+        best_index = None
+        best_score = self.similarity_threshold * 100
+        
+        for search_str in search_strings:
+            result = process.extractOne(search_str, pdf_names, scorer=fuzz.ratio,
+                                        score_cutoff=best_score)
+            # Ties keep the match found first
+            if result is not None and (best_index is None or result[1] > best_score):
+                best_score = result[1]
+                best_index = result[2]
+        
+        return pdf_files[best_index] if best_index is not None else None
     
     def match_all_papers(self, 
                         papers: List[PaperMetadata], 
@@ -79,10 +124,14 @@ class PDFMatcher:
         """
         matches = {}
         
+        # Filenames are the same for every paper, so normalize and index them once
+        pdf_names = self._pdf_names(pdf_files)
+        exact = self._exact_names(pdf_files, pdf_names)
+        
         for paper in papers:
             self.stats['papers_checked'] += 1
             
-            matched_pdf = self.match_paper_to_pdf(paper, pdf_files)
+            matched_pdf = self._best_match(paper, pdf_files, pdf_names, exact) if pdf_files else None
             matches[paper.paper_id] = matched_pdf
             
             if matched_pdf:
@@ -120,9 +169,11 @@ class PDFMatcher:
         
         return search_strings
     
-    def _clean_string(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _clean_string(text: str) -> str:
         """
-        Clean string for comparison.
+        Clean string for comparison (memoized; titles repeat across matching runs).
         
         Args:
             text: Input string
@@ -130,34 +181,8 @@ class PDFMatcher:
         Returns:
             Cleaned string
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove common words
-        stop_words = ['a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for']
-        words = text.split()
-        words = [w for w in words if w not in stop_words]
-        
-        # Join with underscores
-        text = '_'.join(words)
-        
-        # Remove special characters
-        text = ''.join(c for c in text if c.isalnum() or c == '_')
-        
-        return text
-    
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """
-        Calculate similarity between two strings.
-        
-        Args:
-            str1: First string
-            str2: Second string
-            
-        Returns:
-            Similarity score (0-1)
-        """
-        return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+        # Lowercase, remove common words, join with underscores, drop special characters
+        return _NON_WORD_RE.sub('', '_'.join(w for w in text.lower().split() if w not in _STOP_WORDS))
     
     def get_statistics(self) -> Dict:
         """Get matching statistics."""
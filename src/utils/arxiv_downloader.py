@@ -1,117 +1,261 @@
 """Download papers from arXiv."""
+import hashlib
+import json
+import logging
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Tuple
+import threading
 import time
 import re
+from functools import lru_cache
 from urllib.parse import quote
 
+logger = logging.getLogger(__name__)
+
+# Words ignored when comparing titles
+_TITLE_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+
+@lru_cache(maxsize=4096)
+def _title_tokens(title: str) -> frozenset:
+    """Lowercased title words minus stop words (cached; local titles recur across searches)."""
+    return frozenset(title.lower().split()) - _TITLE_STOP_WORDS
+
+
+def title_similarity(title1: str, title2: str) -> float:
+    """Jaccard overlap of the two titles' words, ignoring stop words and case."""
+    words1 = _title_tokens(title1)
+    words2 = _title_tokens(title2)
+    
+    if not words1 or not words2:
+        return 0.0
+    
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
+
 
 class ArxivDownloader:
     """Download papers from arXiv using their API."""
     
-    def __init__(self, delay: float = 3.0):
+    # Bytes read from the socket per write when streaming a PDF to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    
+    # File buffer for downloads, so chunks reach the disk in one write() per MB
+    DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+    
+    # Downloads larger than this are not papers and are discarded
+    MAX_PDF_BYTES = 500 * 1024 * 1024
+    
+    # Seconds a cached search result stays valid; "not found" expires sooner, since
+    # preprints appear later (no longer than ResolverChain.MISS_TTL)
+    SEARCH_CACHE_TTL = 30 * 24 * 3600
+    SEARCH_MISS_TTL = 7 * 24 * 3600
+    
+    def __init__(self, delay: float = 3.0, pool_size: int = 8,
+                 cache_dir: Optional[str] = "data/cache/arxiv",
+                 session: Optional[requests.Session] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.base_url = "http://export.arxiv.org/api/query"
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
+        # A caller-provided session is shared with other clients and closed by its owner
+        self.session = session if session is not None else self.create_session(pool_size)
+        # arXiv asks for at most one API query every few seconds, even across threads
+        self._api_lock = threading.Lock()
+        self._last_api_request = 0.0
+    
+    @staticmethod
+    def create_session(pool_size: int = 8) -> requests.Session:
+        """HTTP session that keeps up to `pool_size` keep-alive connections per host."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
             'User-Agent': 'ResearchReader/1.0 (Academic research tool)'
         })
+        return session
+    
+    def _wait_for_api_slot(self):
+        """Block until `delay` seconds have passed since the previous API query."""
+        with self._api_lock:
+            wait = self._last_api_request + self.delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_api_request = time.monotonic()
     
-    def search_paper(self, title: str, max_results: int = 5) -> Optional[dict]:
-        """Search for a paper on arXiv by title."""
+    def _cache_path(self, title: str, max_results: int) -> Optional[Path]:
+        """Path of the cached search result for this query (None if caching is off)."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(f"{max_results}:{title}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _read_cached_search(self, cache_path: Optional[Path]) -> Tuple[bool, Optional[dict]]:
+        """Return (hit, result) for a cached search that hasn't expired."""
+        if cache_path is None:
+            return False, None
         try:
-            clean_title = self._clean_title(title)
-            
-            print(f"Original title: {title}")
-            print(f"Cleaned title: {clean_title}")
-        
-            params = {
-                'search_query': f'all:"{clean_title}"',
-                'start': 0,
-                'max_results': max_results,
-                'sortBy': 'relevance',
-                'sortOrder': 'descending'
-            }
-            print(f"Search query: {params['search_query']}")
-            
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            print(f"Response status: {response.status_code}")
-            
-            root = ET.fromstring(response.content)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-            entries = root.findall('atom:entry', ns)
-            
-            print(f"Found {len(entries)} results")
-            
-            if not entries:
-                return None
-            
-            entry = entries[0]
-            
-            id_elem = entry.find('atom:id', ns)
-            title_elem = entry.find('atom:title', ns)
-            
-            if id_elem is None or id_elem.text is None:
-                return None
-            if title_elem is None or title_elem.text is None:
-                return None
-            
-            arxiv_id = id_elem.text.split('/abs/')[-1]
-            arxiv_title = title_elem.text.strip()
-            
-            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-            
-            authors = []
-            for author in entry.findall('atom:author', ns):
-                name_elem = author.find('atom:name', ns)
-                if name_elem is not None and name_elem.text is not None:
-                    authors.append(name_elem.text)
-            
-            similarity = self._calculate_similarity(title.lower(), arxiv_title.lower())
-            
-            return {
-                'arxiv_id': arxiv_id,
-                'title': arxiv_title,
-                'pdf_url': pdf_url,
-                'authors': authors,
-                'similarity': similarity
-            }
-            
+            age = time.time() - cache_path.stat().st_mtime
+            if age > self.SEARCH_CACHE_TTL:
+                return False, None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        if result is None and age > self.SEARCH_MISS_TTL:
+            return False, None
+        return True, result
+    
+    def _write_cached_search(self, cache_path: Optional[Path], result: Optional[dict]):
+        """Store a search result (including 'not found') for later runs."""
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f'.{threading.get_ident()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            print(f"Could not cache arXiv search: {e}")
+    
+    def search_paper(self, title: str, max_results: int = 5, raise_errors: bool = False) -> Optional[dict]:
+        """
+        Search for a paper on arXiv by title (results are cached on disk).
+        
+        Args:
+            raise_errors: Re-raise failed searches (network errors, HTTP 503, rate
+                limits) instead of returning None, so callers can tell them apart
+                from "not found". Failed searches are never cached either way.
+        """
+        cache_path = self._cache_path(title, max_results)
+        hit, cached = self._read_cached_search(cache_path)
+        if hit:
+            logger.debug("Using cached arXiv search for: %s", title)
+            return cached
+        
+        try:
+            result = self._search_paper_api(title, max_results)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error searching arXiv: {e}")
             return None
+        self._write_cached_search(cache_path, result)
+        return result
+    
+    def _search_paper_api(self, title: str, max_results: int) -> Optional[dict]:
+        """Query the arXiv API; returns a result dict, or None if not found. Errors propagate."""
+        clean_title = self._clean_title(title)
+        
+        print(f"Original title: {title}")
+        print(f"Cleaned title: {clean_title}")
+        
+        params = {
+            'search_query': f'all:"{clean_title}"',
+            'start': 0,
+            'max_results': max_results,
+            'sortBy': 'relevance',
+            'sortOrder': 'descending'
+        }
+        print(f"Search query: {params['search_query']}")
+        
+        self._wait_for_api_slot()
+        response = self.session.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+        
+        print(f"Response status: {response.status_code}")
+        
+        root = ET.fromstring(response.content)
+        ns = {'atom': 'http://www.w3.org/2005/Atom'}
+        entries = root.findall('atom:entry', ns)
+        
+        print(f"Found {len(entries)} results")
+        
+        if not entries:
+            return None
+        
+        entry = entries[0]
+        
+        id_elem = entry.find('atom:id', ns)
+        title_elem = entry.find('atom:title', ns)
+        
+        if id_elem is None or id_elem.text is None:
+            return None
+        if title_elem is None or title_elem.text is None:
+            return None
+        
+        arxiv_id = id_elem.text.split('/abs/')[-1]
+        arxiv_title = title_elem.text.strip()
+        
+        pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+        
+        authors = []
+        for author in entry.findall('atom:author', ns):
+            name_elem = author.find('atom:name', ns)
+            if name_elem is not None and name_elem.text is not None:
+                authors.append(name_elem.text)
+        
+        similarity = self._calculate_similarity(title.lower(), arxiv_title.lower())
+        
+        return {
+            'arxiv_id': arxiv_id,
+            'title': arxiv_title,
+            'pdf_url': pdf_url,
+            'authors': authors,
+            'similarity': similarity
+        }
+    
+    def _stream_validated_download(self, url: str, output_path: Path):
+        """
+        Stream a PDF to a .part file and move it into place once it checks out.
+        
+        Raises ValueError for responses that are not PDFs (usually an HTML
+        access-denied page) or exceed MAX_PDF_BYTES, so they are rejected
+        before anything parses them.
+        """
+        tmp_path = output_path.with_suffix('.part')
+        try:
+            with self.session.get(url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                total = 0
+                tail = b''
+                with open(tmp_path, 'wb', buffering=self.DOWNLOAD_WRITE_BUFFER) as f:
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        if not chunk:
+                            continue
+                        if total == 0 and not chunk.startswith(b'%PDF-'):
+                            raise ValueError("Response is not a PDF (missing %PDF- header)")
+                        total += len(chunk)
+                        if total > self.MAX_PDF_BYTES:
+                            raise ValueError(f"PDF exceeds {self.MAX_PDF_BYTES // (1024 * 1024)} MB")
+                        f.write(chunk)
+                        tail = (tail + chunk)[-4096:]
+            
+            if total < 1000:
+                raise ValueError("Downloaded file is suspiciously small")
+            if b'<html' in tail.lower():
+                raise ValueError("Response ends in an HTML page, not a PDF")
+            
+            tmp_path.replace(output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
     
     def download_pdf(self, pdf_url: str, output_path: Path) -> bool:
         """Download PDF from URL."""
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            response = self.session.get(pdf_url, timeout=60, stream=True)
-            response.raise_for_status()
-            
-            content_type = response.headers.get('Content-Type', '')
-            if 'application/pdf' not in content_type:
-                print(f"Warning: Content type is {content_type}, not PDF")
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            if output_path.stat().st_size < 1000:
-                print("Warning: Downloaded file is suspiciously small")
-                output_path.unlink()
-                return False
-            
+            self._stream_validated_download(pdf_url, output_path)
             return True
             
         except Exception as e:
             print(f"Error downloading PDF: {e}")
-            if output_path.exists():
-                output_path.unlink()
             return False
     
     def search_and_download(self, title: str, output_path: Path, min_similarity: float = 0.6
@@ -160,17 +304,5 @@ class ArxivDownloader:
     
     def _calculate_similarity(self, title1: str, title2: str) -> float:
         """Calculate simple similarity between two titles using word overlap."""
-        words1 = set(title1.lower().split())
-        words2 = set(title2.lower().split())
-        
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        return len(intersection) / len(union) if union else 0.0
\ No newline at end of file
+        return title_similarity(title1, title2)
+
@@ -1,23 +1,21 @@
 """Generate conference summaries using LLM."""
-from typing import Optional, List
-import yaml
+from typing import Optional, List, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..core.models import PaperMetadata
 from ..extractors.ollama_client import OllamaClient
 from ..extractors.prompts import CONFERENCE_SUMMARY_PROMPT
-from ..storage.database import PaperDatabase
+from ..core.conference import load_config
+from ..storage.database import get_default_database
 
 
 class ConferenceSummarizer:
     """Generate summaries of conference paper collections."""
     
     def __init__(self, config_path: str = "config/config.yaml"):
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        model_name = config['model']['name']
+        model_name = load_config(config_path)['model']['name']
         self.client = OllamaClient(model_name=model_name)
-        self.db = PaperDatabase()
+        self.db = get_default_database()
 
     def get_or_generate_summary(self, conference_name: str, force_regenerate: bool = False) -> Optional[str]:
         """Get existing summary or generate new one."""
@@ -29,8 +27,36 @@ class ConferenceSummarizer:
                 print(f"Using cached summary from {stored['generated_at']}")
                 return stored['summary']
         
-        print(f"Generating new summary for {conference_name}...")
         papers = self.db.get_conference_papers(conference_name, limit=30)
+        return self._summarize_and_save(conference_name, papers)
+    
+    def regenerate_summaries(self, conference_names: List[str],
+                             max_workers: int = 4) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Regenerate summaries for several conferences concurrently.
+        
+        Papers for all conferences are fetched in one query; LLM calls overlap.
+        
+        Args:
+            conference_names: Conferences to summarize
+            max_workers: Number of concurrent summary requests
+            
+        Yields:
+            (conference_name, summary) tuples as each summary completes
+        """
+        papers_by_conference = self.db.get_papers_by_conferences(conference_names, limit=30)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._summarize_and_save, name, papers_by_conference.get(name, [])): name
+                for name in conference_names
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
+    def _summarize_and_save(self, conference_name: str, papers: List[PaperMetadata]) -> Optional[str]:
+        """Generate a summary from papers and store it."""
+        print(f"Generating new summary for {conference_name}...")
         print(f"Found {len(papers)} papers for summarization")
         if not papers:
             return None
@@ -1,52 +1,119 @@
 """Service for managing paper downloads."""
+import logging
+import os
+import re
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .arxiv_downloader import ArxivDownloader
-from ..storage.database import PaperDatabase
+from .pdf_resolver import ResolverChain, OpenAlexResolver, ArxivResolver
+from ..storage.database import get_default_database
 from ..core.models import PaperMetadata
 from ..extractors.pdf_extractor import PDFExtractor
 
+logger = logging.getLogger(__name__)
+
+# Characters not allowed in generated PDF filenames (same set as "not isalnum() and not in ' -_'")
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w -]')
+
 
 class DownloadService:
     """Coordinate downloading papers and updating database."""
     
+    # Papers processed between database commits in download_all_missing
+    COMMIT_EVERY = 50
+    
     def __init__(self, conferences_root: str = "data/conferences"):
         self.conferences_root = Path(conferences_root)
-        self.arxiv_downloader = ArxivDownloader()
-        self.database = PaperDatabase()
+        # One pooled session for every lookup and download, so keep-alive
+        # connections (and their TLS handshakes) are reused across papers
+        self.session = ArxivDownloader.create_session(pool_size=32)
+        self.arxiv_downloader = ArxivDownloader(session=self.session)
+        # OpenAlex first: it is not bound by arXiv's one-query-per-3s limit
+        self.pdf_resolver = ResolverChain([
+            OpenAlexResolver(self.session),
+            ArxivResolver(self.arxiv_downloader),
+        ], cache_path=self.conferences_root / '.pdf_resolver_cache.json')
+        self.database = get_default_database()
         self.pdf_extractor = PDFExtractor()
     
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def download_paper(self, paper: PaperMetadata, conference_name: str
     ) -> Tuple[bool, str]:
         """Download paper PDF, extract detailed overview, and update database."""
+        success, message, row = self._download_and_extract(paper, conference_name)
+        if row:
+            self.database.update_pdf_batch([row])
+        self.pdf_resolver.save()
+        return success, message
+    
+    def _download_and_extract(self, paper: PaperMetadata, conference_name: str,
+                              existing: Optional[Set[str]] = None
+    ) -> Tuple[bool, str, Optional[tuple]]:
+        """Download paper PDF and extract its overview, leaving the database write to the caller.
+        
+        Args:
+            existing: PDF filenames already in the conference's pdfs folder; checked
+                instead of stat'ing the output path, and updated on success
+        
+        Returns:
+            (success, message, (paper_id, overview, pdf_path, pdf_url) or None)
+        """
         pdf_filename = self._generate_pdf_filename(paper)
         output_path = self.conferences_root / conference_name / "pdfs" / pdf_filename
         
-        if output_path.exists():
-            return False, "PDF already exists locally"
-        
-        success, message, arxiv_data = self.arxiv_downloader.search_and_download(
-            paper.title,
-            output_path
-        )
-        
-        if not success:
-            return False, message
-        
-        pdf_url = arxiv_data.get('pdf_url') if arxiv_data else None
+        if existing is not None:
+            already_downloaded = pdf_filename in existing
+        else:
+            already_downloaded = output_path.exists()
+        if already_downloaded:
+            # An earlier run saved the file but not its database row (crash or failed
+            # commit); finish the job from disk instead of re-downloading or giving up
+            cached = self.pdf_resolver.cached_hit(paper.title)
+            pdf_url = cached['pdf_url'] if cached else None
+            message = "Recovered PDF already on disk"
+        else:
+            # Fall through to the next source when a candidate URL doesn't yield a valid PDF
+            resolved = None
+            failed_sources = []
+            for candidate in self.pdf_resolver.candidates(paper.title):
+                if self.arxiv_downloader.download_pdf(candidate['pdf_url'], output_path):
+                    resolved = candidate
+                    self.pdf_resolver.mark_downloaded(paper.title, candidate)
+                    break
+                failed_sources.append(candidate['source'])
+            
+            if resolved is None:
+                if failed_sources:
+                    return False, f"Failed to download PDF from {', '.join(failed_sources)}", None
+                return False, "Paper not found on OpenAlex or arXiv", None
+            
+            pdf_url = resolved['pdf_url']
+            message = f"Downloaded from {resolved['source']}: {resolved['id']}"
 
-        print(f"Extracting detailed overview from PDF...")
+        logger.debug("Extracting detailed overview from %s", output_path)
         detailed_overview = self.pdf_extractor.extract_detailed_overview(output_path)
         
         if not detailed_overview:
-            output_path.unlink()
-            return False, f"{message} | Failed to extract overview from PDF"
-        
-        self.database.update_overview(paper.paper_id, detailed_overview)
-        self.database.update_pdf_info(paper.paper_id, str(output_path), pdf_url)
-        
-        return True, f"{message} | Overview updated from PDF"
+            if not already_downloaded:
+                # Only remove what this call wrote; a PDF the user already had stays
+                output_path.unlink()
+            return False, f"{message} | Failed to extract overview from PDF", None
+        
+        if existing is not None:
+            existing.add(pdf_filename)
+        row = (paper.paper_id, detailed_overview, str(output_path), pdf_url)
+        return True, f"{message} | Overview updated from PDF", row
     
     def download_paper_from_url(self, paper: PaperMetadata, conference_name: str, url: str) -> Tuple[bool, str]:
         """Download paper from manual URL and extract overview."""
@@ -61,29 +128,22 @@ class DownloadService:
         if not success:
             return False, message
         
-        print(f"Extracting detailed overview from PDF...")
+        logger.debug("Extracting detailed overview from %s", output_path)
         detailed_overview = self.pdf_extractor.extract_detailed_overview(output_path)
         
         if not detailed_overview:
             output_path.unlink()
             return False, f"{message} | Failed to extract overview from PDF"
         
-        self.database.update_overview(paper.paper_id, detailed_overview)
-        self.database.update_pdf_info(paper.paper_id, str(output_path), url)
+        self.database.update_pdf_batch([(paper.paper_id, detailed_overview, str(output_path), url)])
         
         return True, f"{message} | Overview updated from PDF"
         
-    def download_all_missing(self, conference_name: Optional[str] = None) -> dict:
-        """Download all papers that don't have PDFs."""
-        all_papers = self.database.get_all_papers()
-        
-        if conference_name:
-            papers_to_download = [
-                p for p in all_papers 
-                if not p.pdf_found and p.conference_name == conference_name
-            ]
-        else:
-            papers_to_download = [p for p in all_papers if not p.pdf_found]
+    def download_all_missing(self, conference_name: Optional[str] = None, max_workers: int = 4) -> dict:
+        """Download all papers that don't have PDFs, several at a time."""
+        # Saved papers have pdf_found = 1, so a re-run after a crash resumes here
+        # on its own; known misses are skipped by the resolver's cache
+        papers_to_download = self.database.get_missing_papers(conference_name)
         
         stats = {
             'total': len(papers_to_download),
@@ -91,27 +151,68 @@ class DownloadService:
             'failed': 0,
             'errors': []
         }
-        print(f"Found {stats['total']} papers to download PDFs for.")
-        for paper in papers_to_download:
-            conf_name = paper.conference_name or conference_name or "unknown"
-            success, message = self.download_paper(paper, conf_name)
-            print(f"Paper: {paper.title} - {'Success' if success else 'Failed'}: {message}")
-            if success:
-                stats['success'] += 1
-            else:
-                stats['failed'] += 1
-                stats['errors'].append({
-                    'title': paper.title,
-                    'error': message
-                })
-        print(f"Download summary: {stats['success']} succeeded, {stats['failed']} failed out of {stats['total']}")
+        logger.info("Found %d papers to download PDFs for", stats['total'])
+        since_commit = 0
+        # Database rows for successful downloads, committed COMMIT_EVERY papers at a time
+        pending_rows = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # List each conference's pdfs folder once rather than stat'ing every output path
+                existing_by_conference = {}
+                futures = {}
+                for paper in papers_to_download:
+                    paper_conference = paper.conference_name or conference_name or "unknown"
+                    if paper_conference not in existing_by_conference:
+                        existing_by_conference[paper_conference] = self._existing_pdf_names(paper_conference)
+                    future = executor.submit(self._download_and_extract, paper, paper_conference,
+                                             existing_by_conference[paper_conference])
+                    futures[future] = paper
+                for future in as_completed(futures):
+                    paper = futures[future]
+                    try:
+                        success, message, row = future.result()
+                    except Exception as e:
+                        success, message, row = False, f"Error: {e}", None
+                    if row:
+                        pending_rows.append(row)
+                    logger.debug("Paper: %s - %s: %s", paper.title, 'Success' if success else 'Failed', message)
+                    if success:
+                        stats['success'] += 1
+                    else:
+                        stats['failed'] += 1
+                        stats['errors'].append({
+                            'title': paper.title,
+                            'error': message
+                        })
+                    
+                    since_commit += 1
+                    if since_commit >= self.COMMIT_EVERY:
+                        # Rows that fail to commit stay pending and are retried next time
+                        if self.database.update_pdf_batch(pending_rows):
+                            pending_rows = []
+                        self.pdf_resolver.save()
+                        since_commit = 0
+        finally:
+            # Anything still unsaved is recovered from its file on disk by the next run
+            self.database.update_pdf_batch(pending_rows)
+            self.pdf_resolver.save()
+        
+        logger.info("Download summary: %d succeeded, %d failed out of %d",
+                    stats['success'], stats['failed'], stats['total'])
         
         return stats
     
+    def _existing_pdf_names(self, conference_name: str) -> Set[str]:
+        """Names of the PDFs already downloaded for a conference."""
+        try:
+            with os.scandir(self.conferences_root / conference_name / "pdfs") as entries:
+                return {entry.name for entry in entries if entry.name.endswith('.pdf')}
+        except FileNotFoundError:
+            return set()
+    
     def _generate_pdf_filename(self, paper: PaperMetadata) -> str:
         """Generate PDF filename from paper metadata."""
-        title_part = paper.title[:50]
-        title_part = ''.join(c if c.isalnum() or c in ' -_' else '_' for c in title_part)
+        title_part = _UNSAFE_FILENAME_CHARS.sub('_', paper.title[:50])
         title_part = '_'.join(title_part.split())
         
         return f"{title_part}_{paper.paper_id[:8]}.pdf"
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""Resolve open-access PDF URLs for papers from several sources."""
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Iterator
+
+import requests
+
+from .arxiv_downloader import ArxivDownloader, title_similarity
+
+
+class RateLimiter:
+    """Allow at most `rate` calls per second, shared across threads."""
+    
+    def __init__(self, rate: float):
+        self.min_interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._last_call = 0.0
+    
+    def wait(self):
+        """Block until the next call is allowed."""
+        with self._lock:
+            wait = self._last_call + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_call = time.monotonic()
+
+
+class OpenAlexResolver:
+    """Find open-access PDFs through the OpenAlex works search."""
+    
+    name = "OpenAlex"
+    
+    def __init__(self, session: requests.Session, min_similarity: float = 0.6,
+                 rate: float = 30.0, mailto: Optional[str] = None):
+        """
+        Args:
+            session: HTTP session to reuse
+            min_similarity: Minimum title word overlap for accepting a result
+            rate: Maximum requests per second
+            mailto: Contact email for OpenAlex's polite pool
+        """
+        self.session = session
+        self.min_similarity = min_similarity
+        self.mailto = mailto
+        self.limiter = RateLimiter(rate)
+    
+    def resolve(self, title: str) -> Optional[dict]:
+        """Return {'pdf_url', 'title', 'id'} for the best match, or None if there is none."""
+        params = {'search': title, 'per-page': 5, 'select': 'id,title,best_oa_location'}
+        if self.mailto:
+            params['mailto'] = self.mailto
+        
+        self.limiter.wait()
+        response = self.session.get("https://api.openalex.org/works", params=params, timeout=30)
+        response.raise_for_status()
+        
+        for work in response.json().get('results', []):
+            location = work.get('best_oa_location') or {}
+            pdf_url = location.get('pdf_url')
+            work_title = work.get('title') or ''
+            if pdf_url and title_similarity(title, work_title) >= self.min_similarity:
+                return {'pdf_url': pdf_url, 'title': work_title, 'id': work.get('id')}
+        
+        return None
+
+
+class ArxivResolver:
+    """Find PDFs through the arXiv API (rate-limited by the downloader)."""
+    
+    name = "arXiv"
+    
+    def __init__(self, downloader: ArxivDownloader, min_similarity: float = 0.6):
+        self.downloader = downloader
+        self.min_similarity = min_similarity
+    
+    def resolve(self, title: str) -> Optional[dict]:
+        """Return {'pdf_url', 'title', 'id'} for the best match, or None if there is none.
+        
+        Failed searches raise, so ResolverChain doesn't cache them as misses.
+        """
+        result = self.downloader.search_paper(title, raise_errors=True)
+        if not result or result['similarity'] < self.min_similarity:
+            return None
+        return {'pdf_url': result['pdf_url'], 'title': result['title'], 'id': result['arxiv_id']}
+
+
+class ResolverChain:
+    """
+    Try PDF sources in priority order until one yields a PDF that downloads.
+    
+    Results are cached per normalized title, including misses, so re-running
+    downloads doesn't query every source again for papers known to be missing.
+    A hit is only cached once its PDF downloaded; a miss only when every
+    source answered without one. Errors and failed downloads are retried.
+    With a cache_path, the cache is loaded at start and written by save().
+    """
+    
+    # Seconds a cached hit / miss stays valid (misses expire sooner: new preprints appear)
+    HIT_TTL = 30 * 24 * 3600
+    MISS_TTL = 7 * 24 * 3600
+    
+    def __init__(self, resolvers: List, cache_path: Optional[Path] = None):
+        self.resolvers = resolvers
+        self.cache_path = Path(cache_path) if cache_path else None
+        # normalized title -> (time cached, result or None)
+        self._cache: Dict[str, Tuple[float, Optional[dict]]] = {}
+        self._cache_lock = threading.Lock()
+        self._dirty = False
+        self._load_cache()
+    
+    @staticmethod
+    def _normalize(title: str) -> str:
+        return ' '.join(re.sub(r'[^\w\s]', ' ', title.lower()).split())
+    
+    def candidates(self, title: str) -> Iterator[dict]:
+        """
+        Yield PDF candidates for a title, best source first.
+        
+        A cached hit comes first, then each source's answer in priority order.
+        Callers stop once a candidate downloads and report it with
+        mark_downloaded(); a URL is only cached as a hit after that.
+        
+        Yields:
+            {'pdf_url', 'title', 'id', 'source'} dicts
+        """
+        key = self._normalize(title)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        tried_urls = set()
+        if entry is not None and not self._expired(entry):
+            if entry[1] is None:
+                return  # every source recently said it doesn't have this paper
+            tried_urls.add(entry[1]['pdf_url'])
+            yield entry[1]
+            # Asked for more, so the cached URL no longer downloads; stop trusting it
+            with self._cache_lock:
+                if self._cache.get(key) is entry:
+                    del self._cache[key]
+                    self._dirty = True
+        
+        complete = True
+        found = False
+        for resolver in self.resolvers:
+            try:
+                result = resolver.resolve(title)
+            except Exception as e:
+                print(f"{resolver.name} lookup failed: {e}")
+                complete = False
+                continue
+            if result and result['pdf_url'] not in tried_urls:
+                found = True
+                result['source'] = resolver.name
+                tried_urls.add(result['pdf_url'])
+                yield result
+        
+        # Only cache a miss when every source answered and none had the paper;
+        # candidates that failed to download are retried next time
+        if complete and not found:
+            with self._cache_lock:
+                self._cache[key] = (time.time(), None)
+                self._dirty = True
+    
+    def cached_hit(self, title: str) -> Optional[dict]:
+        """The candidate that last downloaded for this title, if still cached."""
+        with self._cache_lock:
+            entry = self._cache.get(self._normalize(title))
+        if entry is None or self._expired(entry):
+            return None
+        return entry[1]
+    
+    def mark_downloaded(self, title: str, candidate: dict):
+        """Cache a candidate as the title's hit once its PDF downloaded and validated."""
+        with self._cache_lock:
+            self._cache[self._normalize(title)] = (time.time(), candidate)
+            self._dirty = True
+    
+    def _expired(self, entry: Tuple[float, Optional[dict]]) -> bool:
+        cached_at, result = entry
+        return time.time() - cached_at > (self.HIT_TTL if result else self.MISS_TTL)
+    
+    def _load_cache(self):
+        """Load unexpired entries saved by an earlier run."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._cache = {key: (cached_at, result) for key, (cached_at, result) in data.items()
+                           if not self._expired((cached_at, result))}
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Ignoring unreadable PDF resolver cache: {e}")
+    
+    def save(self):
+        """Write the cache to cache_path if anything was added since the last save."""
+        if self.cache_path is None:
+            return
+        with self._cache_lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._cache)
+            self._dirty = False
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            tmp_path.replace(self.cache_path)
+        except OSError as e:
+            print(f"Could not save PDF resolver cache: {e}")
@@ -3,19 +3,20 @@ Helper functions for Streamlit app
 """
 
 import streamlit as st
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from ..core.models import PaperMetadata
 
 
-@st.cache_resource
+@st.cache_resource(max_entries=1)
 def get_database():
     """Get database connection (cached)."""
-    from src.storage.database import PaperDatabase
-    return PaperDatabase()
+    from src.storage.database import get_default_database
+    return get_default_database()
 
 
-@st.cache_resource
+@st.cache_resource(max_entries=1)
 def get_conference_manager():
     """Get conference manager (cached)."""
     from src.core.conference import ConferenceManager
@@ -28,13 +29,13 @@ def render_paper_card(paper, show_details: bool = False):
     
     with col1:
         st.markdown(f"### {paper.title}")
-        st.caption(f"**Authors:** {paper.get_authors_string()}")
+        st.caption(f"**Authors:** {paper.authors_string}")
         
-        if paper.overview:
+        overview = paper.overview
+        if overview:
             length = 300 if show_details else 150
-            overview = paper.overview[:length]
-            if len(paper.overview) > length:
-                overview += "..."
+            if len(overview) > length:
+                overview = overview[:length] + "..."
             st.write(overview)
     
     with col2:
@@ -48,14 +49,20 @@ def render_paper_card(paper, show_details: bool = False):
 
 def render_paper_table(papers: List) -> None:
     """Render papers as table."""
+    # Fill the columns in one pass over the papers
+    titles, author_counts, pdf_flags = [], [], []
+    for p in papers:
+        titles.append(p.title[:50])
+        author_counts.append(len(p.authors))
+        pdf_flags.append("📄" if p.pdf_found else "❌")
+    
     data = {
-        "Title": [p.title[:50] for p in papers],
-        "Authors": [len(p.authors) for p in papers],
-        "Status": ["✅" if p.verified else "⏳" for p in papers],
-        "PDF": ["📄" if p.pdf_found else "❌" for p in papers],
+        "Title": titles,
+        "Authors": author_counts,
+        "PDF": pdf_flags,
     }
     
-    st.dataframe(data, use_container_width=True, hide_index=True)
+    st.dataframe(data, width="stretch", hide_index=True)
 
 
 def format_author_list(authors: List, max_display: int = 3) -> str:
@@ -63,19 +70,26 @@ def format_author_list(authors: List, max_display: int = 3) -> str:
     if not authors:
         return "Unknown"
     
-    if len(authors) <= max_display:
-        return ", ".join([a.name for a in authors])
+    return _format_author_names(tuple(a.name for a in authors), max_display)
+
+
+@lru_cache(maxsize=8192)
+def _format_author_names(names: tuple, max_display: int) -> str:
+    """Join author names, cached because the same papers re-render on every rerun."""
+    if len(names) <= max_display:
+        return ", ".join(names)
     else:
-        first = ", ".join([a.name for a in authors[:max_display]])
-        remaining = len(authors) - max_display
+        first = ", ".join(names[:max_display])
+        remaining = len(names) - max_display
         return f"{first}, +{remaining} more"
 
+
 def display_paper_detail(paper: PaperMetadata):
     """Display detailed view of a paper."""
     
     # Header
     st.markdown(f"## {paper.title}")
-    st.caption(f"👥 {paper.get_authors_string()}")
+    st.caption(f"👥 {paper.authors_string}")
     
     if paper.conference_name:
         st.badge(paper.conference_name.upper(), icon="📚")
@@ -113,20 +127,20 @@ def display_paper_detail(paper: PaperMetadata):
         if paper.pdf_found and paper.pdf_path:
             pdf_path = Path(paper.pdf_path)
             if pdf_path.exists():
-                with open(pdf_path, "rb") as pdf_file:
-                    st.download_button(
-                        label="📥 Download PDF",
-                        data=pdf_file,
-                        file_name=pdf_path.name,
-                        mime="application/pdf",
-                        use_container_width=True
-                    )
+                # Passing the method, not its result, defers the read until the click
+                st.download_button(
+                    label="📥 Download PDF",
+                    data=pdf_path.read_bytes,
+                    file_name=pdf_path.name,
+                    mime="application/pdf",
+                    width="stretch"
+                )
     
     with action_col2:
         if paper.source_files:
             st.caption(f"📁 Source: {Path(paper.source_files[0]).name}")
     
     with action_col3:
-        if st.button("✖️ Close", use_container_width=True):
+        if st.button("✖️ Close", width="stretch"):
             st.session_state.selected_paper_detail = None
             st.rerun()
\ No newline at end of file
@@ -0,0 +1,319 @@
+"""Tests for PaperDatabase against temporary SQLite files."""
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.core.models import Author, PaperMetadata
+from src.storage.database import PaperDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = PaperDatabase(str(tmp_path / "papers.db"))
+    yield database
+    database.close()
+
+
+def make_paper(title, conference="ConfA", authors=("Ada Lovelace",), **fields):
+    return PaperMetadata(
+        title=title,
+        authors=[Author(name=name) for name in authors],
+        conference_name=conference,
+        **fields
+    )
+
+
+def query_plan(db, sql, params=()):
+    """The detail column of EXPLAIN QUERY PLAN, one entry per plan step."""
+    return [row[3] for row in db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+@pytest.fixture
+def populated_db(db):
+    db.save_papers_bulk([
+        make_paper(f"Graph neural network {i}", conference=f"Conf{i % 3}", authors=(f"Author {i}",))
+        for i in range(30)
+    ])
+    return db
+
+
+def test_conference_papers_use_composite_index(populated_db):
+    plan = query_plan(populated_db, """
+        SELECT * FROM papers WHERE conference_name = ? ORDER BY created_at DESC
+    """, ("Conf1",))
+    assert plan == ["SEARCH papers USING INDEX idx_papers_conf_created (conference_name=?)"]
+
+
+def test_most_recent_conference_walks_created_index(populated_db):
+    plan = query_plan(populated_db, """
+        SELECT conference_name FROM papers
+        WHERE conference_name IS NOT NULL
+        ORDER BY created_at DESC
+        LIMIT 1
+    """)
+    assert plan == ["SCAN papers USING INDEX idx_papers_created"]
+
+
+def test_pdf_filters_use_partial_indexes(populated_db):
+    assert query_plan(populated_db, "SELECT COUNT(*) FROM papers WHERE pdf_found = 1") == [
+        "SEARCH papers USING COVERING INDEX idx_papers_pdf_found (pdf_found=?)"
+    ]
+    assert query_plan(populated_db, """
+        SELECT * FROM papers WHERE pdf_found = 0 AND conference_name = ?
+    """, ("Conf1",)) == ["SEARCH papers USING INDEX idx_papers_missing_pdf (conference_name=?)"]
+
+
+def test_author_and_source_lookups_search_by_paper(populated_db):
+    author_plan = query_plan(populated_db, """
+        SELECT pa.paper_id, a.name
+        FROM authors a
+        JOIN paper_authors pa ON a.author_id = pa.author_id
+        WHERE pa.paper_id IN (?, ?)
+        ORDER BY pa.paper_id, pa.author_order
+    """, ("a", "b"))
+    assert "SEARCH pa USING PRIMARY KEY (paper_id=?)" in author_plan
+    assert not any(step.startswith("SCAN") for step in author_plan)
+    
+    assert query_plan(populated_db, """
+        SELECT paper_id, file_path FROM source_files WHERE paper_id IN (?) ORDER BY file_id
+    """, ("a",)) == ["SEARCH source_files USING INDEX idx_source_files_paper (paper_id=?)"]
+
+
+def test_conference_search_keeps_fts_index(populated_db):
+    if not populated_db._fts_enabled:
+        pytest.skip("SQLite built without FTS5")
+    plan = query_plan(populated_db, """
+        WITH fts AS (
+            SELECT rowid, bm25(papers_fts, ?, ?, ?) AS score
+            FROM papers_fts
+            WHERE papers_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+        )
+        SELECT p.*
+        FROM fts
+        JOIN papers p ON p.rowid = fts.rowid
+        WHERE p.conference_name = ?
+        ORDER BY fts.score
+        LIMIT ?
+    """, (*PaperDatabase._FTS_WEIGHTS, '"graph"*', 100, "Conf1", 10))
+    # MATCH is answered by the FTS index (idxStr starting "M"), not a full virtual-table scan
+    assert any(step.startswith("SCAN papers_fts VIRTUAL TABLE INDEX 0:M") for step in plan)
+    assert "SEARCH p USING INTEGER PRIMARY KEY (rowid=?)" in plan
+    assert "SCAN papers" not in plan
+
+
+def fts_row_count(db, paper_id):
+    return db.conn.execute("""
+        SELECT COUNT(*) FROM papers_fts WHERE rowid IN (SELECT rowid FROM papers WHERE paper_id = ?)
+    """, (paper_id,)).fetchone()[0]
+
+
+def test_search_matches_word_prefixes(db):
+    paper = make_paper("Transformers for protein folding")
+    db.save_paper(paper)
+    db.save_paper(make_paper("Reinforcement learning for robots"))
+    
+    results = db.search_papers("transf prot")
+    assert [p.paper_id for p in results] == [paper.paper_id]
+
+
+def test_search_ranks_title_hits_above_overview_hits(db):
+    in_overview = make_paper("Scaling laws", overview="We study diffusion models at scale.")
+    in_title = make_paper("Diffusion models", overview="Image generation.")
+    db.save_papers_bulk([in_overview, in_title])
+    
+    assert [p.paper_id for p in db.search_papers("diffusion")] == [in_title.paper_id, in_overview.paper_id]
+
+
+def test_search_within_conference(db):
+    # More off-conference matches than the limit, so the filter runs on the over-fetched candidates
+    db.save_papers_bulk([make_paper(f"Graph networks {i}", conference="ConfA") for i in range(5)])
+    wanted = make_paper("Graph networks revisited", conference="ConfB")
+    db.save_paper(wanted)
+    
+    results = db.search_papers("graph", limit=2, conference="ConfB")
+    assert [p.paper_id for p in results] == [wanted.paper_id]
+    assert db.search_papers("graph", conference="ConfC") == []
+
+
+def test_resaving_paper_replaces_its_index_entry(db):
+    paper = make_paper("Original title")
+    db.save_paper(paper)
+    
+    paper.title = "Renamed paper"
+    db.save_paper(paper)
+    
+    assert fts_row_count(db, paper.paper_id) == 1
+    assert db.conn.execute("SELECT COUNT(*) FROM papers_fts").fetchone()[0] == 1
+    assert db.search_papers("original") == []
+    assert [p.title for p in db.search_papers("renamed")] == ["Renamed paper"]
+
+
+def test_updating_overview_reindexes_paper(db):
+    paper = make_paper("Some paper", overview="Nothing yet")
+    db.save_paper(paper)
+    
+    assert db.update_overview(paper.paper_id, "Contrastive pretraining")
+    assert fts_row_count(db, paper.paper_id) == 1
+    assert [p.paper_id for p in db.search_papers("contrastive")] == [paper.paper_id]
+
+
+def test_deleting_paper_removes_its_index_entry(db):
+    paper = make_paper("Deleted paper")
+    kept = make_paper("Kept paper")
+    db.save_papers_bulk([paper, kept])
+    
+    assert db.delete_paper(paper.paper_id)
+    assert db.get_paper(paper.paper_id) is None
+    assert db.conn.execute("SELECT COUNT(*) FROM papers_fts").fetchone()[0] == 1
+    assert [p.paper_id for p in db.search_papers("paper")] == [kept.paper_id]
+
+
+def test_like_fallback_searches_titles_authors_and_overviews(db):
+    by_title = make_paper("Sparse attention", authors=("Grace Hopper",))
+    by_author = make_paper("Unrelated", authors=("Alan Sparse",))
+    by_overview = make_paper("Other", overview="A sparse method.", conference="ConfB")
+    db.save_papers_bulk([by_title, by_author, by_overview])
+    db._fts_enabled = False
+    
+    assert {p.paper_id for p in db.search_papers("SPARSE")} == {
+        by_title.paper_id, by_author.paper_id, by_overview.paper_id
+    }
+    assert [p.paper_id for p in db.search_papers("sparse", conference="ConfB")] == [by_overview.paper_id]
+
+
+# Schema of databases created before the migrations in PaperDatabase._create_tables
+BASELINE_SCHEMA = """
+    CREATE TABLE papers (
+        paper_id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        overview TEXT,
+        conference_name TEXT,
+        pdf_found BOOLEAN DEFAULT 0,
+        pdf_path TEXT,
+        pdf_url TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        version INTEGER DEFAULT 1
+    );
+    CREATE TABLE authors (
+        author_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        UNIQUE(name)
+    );
+    CREATE TABLE paper_authors (
+        paper_id TEXT,
+        author_id INTEGER,
+        author_order INTEGER,
+        FOREIGN KEY (paper_id) REFERENCES papers(paper_id),
+        FOREIGN KEY (author_id) REFERENCES authors(author_id),
+        PRIMARY KEY (paper_id, author_id)
+    );
+    CREATE TABLE source_files (
+        file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        paper_id TEXT,
+        file_path TEXT NOT NULL,
+        file_type TEXT,
+        FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+    );
+    CREATE TABLE conference_summaries (
+        conference_name TEXT PRIMARY KEY,
+        summary TEXT NOT NULL,
+        generated_at TEXT NOT NULL,
+        paper_count INTEGER
+    );
+"""
+
+
+def test_baseline_database_is_migrated_in_place(tmp_path):
+    db_path = tmp_path / "papers.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(BASELINE_SCHEMA)
+    now = "2024-01-01T00:00:00"
+    conn.executemany("""
+        INSERT INTO papers (paper_id, title, overview, conference_name, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [
+        ("p1", "Image paper", "Sparse attention", "ConfA", now, now),
+        ("p2", "Pdf paper", "Other", "ConfA", now, now),
+        ("p3", "No sources", None, "ConfB", now, now),
+    ])
+    conn.executemany("INSERT INTO authors (author_id, name) VALUES (?, ?)",
+                     [(1, "Zoe First"), (2, "Yan Second"), (3, "Xi Third")])
+    # Author order deliberately differs from author_id order
+    conn.executemany("INSERT INTO paper_authors (paper_id, author_id, author_order) VALUES (?, ?, ?)",
+                     [("p1", 3, 0), ("p1", 1, 1), ("p1", 2, 2), ("p2", 2, 0)])
+    conn.executemany("INSERT INTO source_files (paper_id, file_path, file_type) VALUES (?, ?, ?)", [
+        ("p1", "C:\\Users\\me\\Data\\conferences\\ConfA\\images\\p1.PNG", "image"),
+        ("p1", "C:\\Users\\me\\Data\\conferences\\ConfA\\images\\p1b.png", "image"),
+        ("p2", "/home/me/data/conferences/ConfA/pdfs/p2.pdf", "pdf"),
+    ])
+    conn.commit()
+    conn.close()
+    
+    db = PaperDatabase(str(db_path))
+    try:
+        table_sql = db.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'paper_authors'"
+        ).fetchone()[0]
+        assert "WITHOUT ROWID" in table_sql.upper()
+        
+        image_paper = db.get_paper("p1")
+        assert [a.name for a in image_paper.authors] == ["Xi Third", "Zoe First", "Yan Second"]
+        assert image_paper.source_files == [
+            "C:\\Users\\me\\Data\\conferences\\ConfA\\images\\p1.PNG",
+            "C:\\Users\\me\\Data\\conferences\\ConfA\\images\\p1b.png",
+        ]
+        assert image_paper.source_rel_path == "Data/conferences/ConfA/images/p1.PNG"
+        assert image_paper.source_is_image
+        
+        pdf_paper = db.get_paper("p2")
+        assert [a.name for a in pdf_paper.authors] == ["Yan Second"]
+        assert pdf_paper.source_rel_path == "data/conferences/ConfA/pdfs/p2.pdf"
+        assert not pdf_paper.source_is_image
+        
+        bare_paper = db.get_paper("p3")
+        assert bare_paper.authors == [] and bare_paper.source_files == []
+        assert bare_paper.source_rel_path is None
+        assert not bare_paper.source_is_image
+        
+        # Existing rows are indexed for search on first open
+        if db._fts_enabled:
+            assert [p.paper_id for p in db.search_papers("xi")] == ["p1"]
+    finally:
+        db.close()
+    
+    # Reopening the migrated database leaves it as it is
+    db = PaperDatabase(str(db_path))
+    try:
+        assert [a.name for a in db.get_paper("p1").authors] == ["Xi Third", "Zoe First", "Yan Second"]
+        assert db.get_paper("p1").source_rel_path == "Data/conferences/ConfA/images/p1.PNG"
+    finally:
+        db.close()
+
+
+def test_failed_write_does_not_leave_transaction_open(db):
+    paper = make_paper("Some paper")
+    db.save_paper(paper)
+    # Fail the UPDATE after its transaction has begun, as a constraint error or full disk would
+    db.conn.execute("CREATE TEMP TRIGGER fail_update AFTER UPDATE ON papers BEGIN SELECT RAISE(ABORT, 'boom'); END")
+    
+    assert not db.update_pdf_info(paper.paper_id, pdf_path="/tmp/x.pdf")
+    assert not db.conn.in_transaction
+    assert not db.update_overview(paper.paper_id, "New overview")
+    assert not db.conn.in_transaction
+
+
+def test_recent_papers_stream_newest_first(db, monkeypatch):
+    monkeypatch.setattr(PaperDatabase, "_IN_CHUNK_SIZE", 2)
+    papers = [
+        make_paper(f"Paper {i}", authors=(f"Author {i}",), created_at=datetime(2024, 1, i + 1))
+        for i in range(5)
+    ]
+    db.save_papers_bulk(papers)
+    
+    recent = list(db.get_recent_papers(4))
+    assert [p.title for p in recent] == ["Paper 4", "Paper 3", "Paper 2", "Paper 1"]
+    assert [p.authors[0].name for p in recent] == ["Author 4", "Author 3", "Author 2", "Author 1"]
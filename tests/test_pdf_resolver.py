@@ -0,0 +1,179 @@
+"""Tests for falling through PDF sources when a download fails."""
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import requests
+
+from src.core.models import PaperMetadata
+from src.utils.download_service import DownloadService
+from src.utils.arxiv_downloader import ArxivDownloader
+from src.utils.pdf_resolver import ArxivResolver, ResolverChain
+
+
+class FakeResolver:
+    def __init__(self, name, pdf_url):
+        self.name = name
+        self.pdf_url = pdf_url
+        self.calls = 0
+    
+    def resolve(self, title):
+        self.calls += 1
+        return {'pdf_url': self.pdf_url, 'title': title, 'id': self.name.lower()}
+
+
+class FakeDownloader:
+    """Writes a file for good URLs and fails (like a rejected HTML page) for the rest."""
+    
+    def __init__(self, good_urls):
+        self.good_urls = set(good_urls)
+        self.attempts = []
+    
+    def download_pdf(self, pdf_url, output_path):
+        self.attempts.append(pdf_url)
+        if pdf_url not in self.good_urls:
+            return False
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b'%PDF-1.4')
+        return True
+
+
+def make_service(tmp_path, resolvers, downloader):
+    service = DownloadService.__new__(DownloadService)
+    service.conferences_root = Path(tmp_path)
+    service.pdf_resolver = ResolverChain(resolvers, cache_path=Path(tmp_path) / 'cache.json')
+    service.arxiv_downloader = downloader
+    service.pdf_extractor = SimpleNamespace(
+        extract_detailed_overview=lambda path: "overview"
+    )
+    return service
+
+
+def test_failed_first_source_falls_through_to_second(tmp_path):
+    openalex = FakeResolver("OpenAlex", "https://publisher.example/landing")
+    arxiv = FakeResolver("arXiv", "https://arxiv.org/pdf/1234.5678")
+    downloader = FakeDownloader(good_urls=[arxiv.pdf_url])
+    service = make_service(tmp_path, [openalex, arxiv], downloader)
+    paper = PaperMetadata(title="Some Paper Title")
+    
+    success, message, row = service._download_and_extract(paper, "conf")
+    
+    assert success
+    assert "arXiv" in message
+    assert row[3] == arxiv.pdf_url
+    assert downloader.attempts == [openalex.pdf_url, arxiv.pdf_url]
+    
+    # Only the URL that downloaded is cached as the hit
+    cached = next(service.pdf_resolver.candidates("some paper title"))
+    assert cached['pdf_url'] == arxiv.pdf_url
+    assert cached['source'] == "arXiv"
+
+
+def test_failed_downloads_are_not_cached(tmp_path):
+    openalex = FakeResolver("OpenAlex", "https://publisher.example/landing")
+    arxiv = FakeResolver("arXiv", "https://arxiv.org/pdf/1234.5678")
+    downloader = FakeDownloader(good_urls=[])
+    service = make_service(tmp_path, [openalex, arxiv], downloader)
+    paper = PaperMetadata(title="Some Paper Title")
+    
+    success, message, row = service._download_and_extract(paper, "conf")
+    assert not success
+    assert row is None
+    assert "OpenAlex" in message and "arXiv" in message
+    
+    # A retry asks both sources again instead of replaying a cached failure
+    service._download_and_extract(paper, "conf")
+    assert openalex.calls == 2
+    assert arxiv.calls == 2
+
+
+def test_pdf_left_on_disk_without_db_row_is_recovered(tmp_path):
+    arxiv = FakeResolver("arXiv", "https://arxiv.org/pdf/1234.5678")
+    downloader = FakeDownloader(good_urls=[arxiv.pdf_url])
+    service = make_service(tmp_path, [arxiv], downloader)
+    paper = PaperMetadata(title="Some Paper Title")
+    
+    # First run downloads the file but its row never reaches the database
+    service._download_and_extract(paper, "conf")
+    
+    success, message, row = service._download_and_extract(paper, "conf")
+    assert success
+    assert "Recovered" in message
+    assert row[0] == paper.paper_id
+    assert row[3] == arxiv.pdf_url
+    assert downloader.attempts == [arxiv.pdf_url]
+
+
+def test_recovered_pdf_survives_failed_extraction(tmp_path):
+    arxiv = FakeResolver("arXiv", "https://arxiv.org/pdf/1234.5678")
+    downloader = FakeDownloader(good_urls=[arxiv.pdf_url])
+    service = make_service(tmp_path, [arxiv], downloader)
+    paper = PaperMetadata(title="Some Paper Title")
+    service._download_and_extract(paper, "conf")
+    output_path = Path(tmp_path) / "conf" / "pdfs" / service._generate_pdf_filename(paper)
+    
+    # Overview extraction fails on the recovery run (e.g. Ollama is offline)
+    service.pdf_extractor = SimpleNamespace(extract_detailed_overview=lambda path: None)
+    success, message, row = service._download_and_extract(paper, "conf")
+    
+    assert not success
+    assert row is None
+    assert output_path.exists()
+
+
+def test_fresh_download_is_removed_when_extraction_fails(tmp_path):
+    arxiv = FakeResolver("arXiv", "https://arxiv.org/pdf/1234.5678")
+    downloader = FakeDownloader(good_urls=[arxiv.pdf_url])
+    service = make_service(tmp_path, [arxiv], downloader)
+    service.pdf_extractor = SimpleNamespace(extract_detailed_overview=lambda path: None)
+    paper = PaperMetadata(title="Some Paper Title")
+    
+    success, message, row = service._download_and_extract(paper, "conf")
+    
+    assert not success
+    assert not (Path(tmp_path) / "conf" / "pdfs" / service._generate_pdf_filename(paper)).exists()
+
+
+def test_arxiv_outage_is_not_cached_as_a_miss(tmp_path):
+    class FailingSession:
+        def get(self, *args, **kwargs):
+            raise requests.ConnectionError("arXiv is down")
+    
+    downloader = ArxivDownloader(delay=0, cache_dir=str(tmp_path / "arxiv"), session=FailingSession())
+    arxiv = ArxivResolver(downloader)
+    chain = ResolverChain([arxiv], cache_path=Path(tmp_path) / 'cache.json')
+    
+    assert list(chain.candidates("Some Paper Title")) == []
+    assert chain.cached_hit("Some Paper Title") is None
+    assert chain._cache == {}
+    assert not (tmp_path / "arxiv").exists()
+
+
+def test_cached_arxiv_miss_expires_with_the_chain_miss_ttl(tmp_path):
+    class EmptyFeedSession:
+        def __init__(self):
+            self.calls = 0
+        
+        def get(self, *args, **kwargs):
+            self.calls += 1
+            return SimpleNamespace(
+                status_code=200,
+                content=b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>',
+                raise_for_status=lambda: None,
+            )
+    
+    session = EmptyFeedSession()
+    downloader = ArxivDownloader(delay=0, cache_dir=str(tmp_path / "arxiv"), session=session)
+    assert downloader.search_paper("Some Paper Title") is None
+    assert downloader.search_paper("Some Paper Title") is None
+    assert session.calls == 1  # the fresh miss comes from disk
+    
+    # Backdate the cached miss past ResolverChain.MISS_TTL, but not past the hit TTL
+    cache_path = downloader._cache_path("Some Paper Title", 5)
+    backdated = time.time() - ResolverChain.MISS_TTL - 60
+    os.utime(cache_path, (backdated, backdated))
+    assert ArxivDownloader.SEARCH_MISS_TTL <= ResolverChain.MISS_TTL
+    
+    assert downloader.search_paper("Some Paper Title") is None
+    assert session.calls == 2